@@ -29,6 +29,7 @@ import hashlib
 import uuid
 import asyncio
 import mimetypes
+import secrets
 from datetime import datetime, timezone
 from pathlib import PurePosixPath
 from typing import List, Optional
@@ -135,7 +136,7 @@ def _generate_document_id() -> str:
 
 def _generate_session_id() -> str:
     ts = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
-    short_id = uuid.uuid4().hex[:8]
+    short_id = secrets.token_hex(4)
     return f"session_{ts}_{short_id}"
 
 
@@ -705,6 +706,17 @@ async def get_batch_progress(
 
     redis_results = await progress_mgr.get_batch_progress(file_ids)
 
+    # Redis 缺失的文件一次性批量 fallback 到 MySQL，避免逐个查询
+    missing_ids = [
+        fid for fid, redis_prog in zip(file_ids, redis_results) if not redis_prog
+    ]
+    mysql_records = {
+        record.file_id: record
+        for record in workspace_file_system_repo.get_by_user_and_files(
+            session, user_id, missing_ids
+        )
+    }
+
     file_progresses: list[FileProgressResponse] = []
     completed = 0
     processing = 0
@@ -721,9 +733,7 @@ async def get_batch_progress(
                 message=redis_prog.message,
             )
         else:
-            file_record = workspace_file_system_repo.get_by_user_and_file(
-                session, user_id, fid
-            )
+            file_record = mysql_records.get(fid)
             if not file_record:
                 resp = FileProgressResponse(
                     file_id=fid,
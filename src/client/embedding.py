@@ -26,7 +26,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 import httpx
 from loguru import logger
@@ -324,6 +324,10 @@ class SparseEmbeddingClient:
         self.retry_strategy: str = str(self._config.get("retry_strategy", "exponential"))
         self.max_retry_delay: float = float(self._config.get("max_retry_delay", 10.0))
 
+        # 重试包装首次使用时构建并缓存，不再每次请求重新装饰
+        self._sparse_batch_with_retry_sync: Optional[Callable[..., List[Dict[int, float]]]] = None
+        self._asparse_batch_with_retry: Optional[Callable[..., Awaitable[List[Dict[int, float]]]]] = None
+
         self.api_key: Optional[str] = self._config.get("api_key")
 
         self._headers: Dict[str, str] = {"Content-Type": "application/json"}
@@ -435,10 +439,8 @@ class SparseEmbeddingClient:
                 client.close()
         return all_sparse
 
-    def _embed_sparse_batch_with_retry_sync(
-        self, texts: List[str]
-    ) -> List[Dict[int, float]]:
-        retry_decorator = retry_sync(
+    def _retry_kwargs(self) -> Dict[str, Any]:
+        return dict(
             max_retries=self.max_retries,
             retry_delay=self.retry_delay,
             retry_strategy=self.retry_strategy,
@@ -447,8 +449,16 @@ class SparseEmbeddingClient:
             logger=logging.getLogger(__name__),
             raise_on_failure=True,
         )
-        wrapped = retry_decorator(self._embed_sparse_batch_sync)
-        return wrapped(texts)
+
+    def _embed_sparse_batch_with_retry_sync(
+        self, texts: List[str]
+    ) -> List[Dict[int, float]]:
+        # 包装未绑定函数、调用时显式传 self，避免实例经绑定方法自引用
+        if self._sparse_batch_with_retry_sync is None:
+            self._sparse_batch_with_retry_sync = retry_sync(**self._retry_kwargs())(
+                type(self)._embed_sparse_batch_sync
+            )
+        return self._sparse_batch_with_retry_sync(self, texts)
 
     # ---------- 异步 ----------
     async def aembed_sparse(self, text: str) -> Dict[int, float]:
@@ -496,18 +506,11 @@ class SparseEmbeddingClient:
     async def _aembed_sparse_batch_with_retry(
         self, texts: List[str]
     ) -> List[Dict[int, float]]:
-        retry_decorator = retry_async(
-            max_retries=self.max_retries,
-            retry_delay=self.retry_delay,
-            retry_strategy=self.retry_strategy,
-            max_delay=self.max_retry_delay,
-            exceptions=(httpx.HTTPError, TimeoutError),
-            logger=logging.getLogger(__name__),
-            raise_on_failure=True,
-            timeout=None,
-        )
-        wrapped = retry_decorator(self._aembed_sparse_batch)
-        return await wrapped(texts)
+        if self._asparse_batch_with_retry is None:
+            self._asparse_batch_with_retry = retry_async(timeout=None, **self._retry_kwargs())(
+                type(self)._aembed_sparse_batch
+            )
+        return await self._asparse_batch_with_retry(self, texts)
 
     async def aembed_sparse_concurrent(
         self,
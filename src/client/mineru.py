@@ -15,10 +15,15 @@
 from typing import Dict, List, Optional
 import uuid
 import requests
+from requests.adapters import HTTPAdapter
 import time
 
 from loguru import logger
 
+# 入库的元素类型；discarded（页眉页脚、页码等）及其它类型在此处直接丢弃，
+# 下游不会为其构建 MySQL / MongoDB 记录
+_VALID_ELEMENT_TYPES = frozenset({'text', 'image', 'table', 'equation'})
+
 
 class Mineru2Client:
     """
@@ -39,12 +44,25 @@ class Mineru2Client:
             mineru_config: 配置字典，需包含以下字段：
                 - api_url: API 基础地址，如 "http://localhost:18000"
                 - timeout: 超时时间（秒），默认 600
+                - pool_maxsize: HTTP 连接池大小，默认 10（不低于分页并发数即可）
         """
         self._mineru_config = mineru_config
         self._api_base_url = mineru_config.get("api_url")
         self._timeout = mineru_config.get("timeout", 600)
         self.logger = logger
 
+        # 复用 HTTP keep-alive 连接：提交 / 轮询 / 取数据共用同一连接池，
+        # 避免每次请求（尤其是每秒一次的状态轮询）重新建立 TCP 连接
+        pool_maxsize = mineru_config.get("pool_maxsize", 10)
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def close(self):
+        """关闭 HTTP 连接池"""
+        self._session.close()
+
     def parse_file(
             self,
             file_bytes: bytes,
@@ -321,7 +339,7 @@ class Mineru2Client:
                 data['end_page_id'] = str(end_page_id)
 
             # 提交任务
-            response = requests.post(
+            response = self._session.post(
                 f'{self._api_base_url}/api/v1/tasks/submit',
                 files=files,
                 data=data,
@@ -350,14 +368,15 @@ class Mineru2Client:
 
         :raises Exception: 任务失败或超时时抛出异常
         """
-        start_time = time.time()
+        # 超时判断使用单调时钟，不受系统时间调整影响
+        deadline = time.monotonic() + self._timeout
 
         self.logger.info(f"⏳ 等待任务完成: {task_id}")
 
         while True:
             # 查询任务状态
             try:
-                response = requests.get(
+                response = self._session.get(
                     f'{self._api_base_url}/api/v1/tasks/{task_id}',
                     timeout=10
                 )
@@ -378,8 +397,7 @@ class Mineru2Client:
                     raise Exception("任务已被取消")
 
                 # 检查超时
-                elapsed_time = time.time() - start_time
-                if elapsed_time > self._timeout:
+                if time.monotonic() > deadline:
                     raise Exception(f"任务超时（{self._timeout}秒）")
 
                 # 添加轮询间隔，避免频繁请求
@@ -399,7 +417,7 @@ class Mineru2Client:
         :raises Exception: 获取数据失败时抛出异常
         """
         try:
-            response = requests.get(
+            response = self._session.get(
                 f'{self._api_base_url}/api/v1/tasks/{task_id}/data',
                 params={
                     'include_fields': 'md,content_list,middle_json,images',
@@ -435,12 +453,12 @@ class Mineru2Client:
         md_content = data_content.get('markdown', {}).get('content', '')
 
         content_list_raw = data_content.get('content_list', {}).get('content', [])
-        valid_types = {'text', 'image', 'table', 'equation'}
         content_list = []
         for item in content_list_raw:
-            if item.get('type') not in valid_types:
+            item_type = item.get('type')
+            if item_type not in _VALID_ELEMENT_TYPES:
                 continue
-            if item.get('type') == 'text' and not item.get('text', '').strip():
+            if item_type == 'text' and not item.get('text', '').strip():
                 continue
             content_list.append(item)
 
@@ -6,8 +6,9 @@
 提供所有 Worker 的通用功能和基础设施支持。
 """
 
+import asyncio
 from abc import ABC
-from typing import Optional, Type
+from typing import Dict, Optional, Tuple, Type
 from aiokafka import AIOKafkaConsumer
 from loguru import logger
 
@@ -17,7 +18,7 @@ from src.db.kafka.deduplication import DeduplicationManager
 from src.db.kafka.retry_manager import RetryManager
 from src.db.kafka.dlq_manager import DLQManager
 from src.states.state_manager import FileProgressManager
-from src.states.states import IndexStatus
+from src.states.states import IndexStatus, stage_to_progress
 from src.types.messages.base import BaseMessage
 
 
@@ -81,6 +82,11 @@ class BaseWorker(BaseKafkaConsumer, ABC):
         self._progress_manager = progress_manager
         self._enable_idempotency = enable_idempotency
         
+        # 中间阶段进度的后台写入（见 _update_file_progress）：
+        # 每个 file_id 至多一个在途写入任务，排队中的进度只保留最新一条
+        self._progress_writers: Dict[str, asyncio.Task] = {}
+        self._queued_progress: Dict[str, Tuple[str, Optional[str]]] = {}
+        
         # 统计信息
         self._duplicate_count = 0
         self._retry_count = 0
@@ -225,6 +231,11 @@ class BaseWorker(BaseKafkaConsumer, ABC):
         更新文件索引进度到 Redis
         
         如果 progress_manager 未配置则静默跳过，不影响主流程。
+        中间阶段（进度 < 100%）的写入允许丢失，放到后台任务执行，不阻塞消息处理；
+        同一文件同时只有一个在途写入，期间到来的新进度覆盖排队中的旧进度，
+        保证写入按顺序落地、不会被旧进度反超。
+        终态阶段（100%）需要可靠落地，先等待该文件的后台写入完成再同步写入，
+        避免旧的中间进度覆盖终态。
         
         Args:
             file_id: 文件 ID
@@ -234,18 +245,37 @@ class BaseWorker(BaseKafkaConsumer, ABC):
         if not self._progress_manager:
             return
         
+        if stage_to_progress(stage) < 1.0:
+            self._queued_progress[file_id] = (stage, message)
+            if file_id not in self._progress_writers:
+                self._progress_writers[file_id] = asyncio.create_task(
+                    self._drain_file_progress(file_id)
+                )
+            return
+        
+        await self._flush_progress_writes(file_id)
+        await self._write_file_progress(
+            file_id, stage, IndexStatus.PROCESSING, message
+        )
+    
+    async def _drain_file_progress(self, file_id: str) -> None:
+        """
+        后台依次写入某个文件排队中的中间进度，直到队列为空
+        
+        Args:
+            file_id: 文件 ID
+        """
         try:
-            await self._progress_manager.update_progress(
-                file_id=file_id,
-                stage=stage,
-                status=IndexStatus.PROCESSING,
-                message=message,
-            )
-        except Exception as e:
-            logger.warning(
-                f"更新 Redis 进度失败（不阻塞主流程）: "
-                f"file_id={file_id}, stage={stage}, error={e}"
-            )
+            while True:
+                queued = self._queued_progress.pop(file_id, None)
+                if queued is None:
+                    return
+                stage, message = queued
+                await self._write_file_progress(
+                    file_id, stage, IndexStatus.PROCESSING, message
+                )
+        finally:
+            self._progress_writers.pop(file_id, None)
     
     async def _fail_file_progress(
         self,
@@ -256,6 +286,8 @@ class BaseWorker(BaseKafkaConsumer, ABC):
         """
         将文件索引进度标记为失败
         
+        失败为终态，先等待该文件的后台进度写入完成，再同步写入。
+        
         Args:
             file_id: 文件 ID
             stage: 失败所在阶段
@@ -264,19 +296,63 @@ class BaseWorker(BaseKafkaConsumer, ABC):
         if not self._progress_manager:
             return
         
+        await self._flush_progress_writes(file_id)
+        await self._write_file_progress(
+            file_id, stage, IndexStatus.FAILED, error_message
+        )
+    
+    async def _write_file_progress(
+        self,
+        file_id: str,
+        stage: str,
+        status: IndexStatus,
+        message: Optional[str],
+    ) -> None:
+        """
+        写入 Redis 进度，失败仅记录日志（不阻塞主流程）
+        
+        Args:
+            file_id: 文件 ID
+            stage: 阶段
+            status: 状态
+            message: 描述信息
+        """
         try:
             await self._progress_manager.update_progress(
                 file_id=file_id,
                 stage=stage,
-                status=IndexStatus.FAILED,
-                message=error_message,
+                status=status,
+                message=message,
             )
         except Exception as e:
             logger.warning(
-                f"更新 Redis 失败状态失败: "
-                f"file_id={file_id}, stage={stage}, error={e}"
+                f"更新 Redis 进度失败（不阻塞主流程）: "
+                f"file_id={file_id}, stage={stage}, status={status.value}, error={e}"
             )
     
+    async def _flush_progress_writes(self, file_id: Optional[str] = None) -> None:
+        """
+        等待后台进度写入完成
+        
+        Args:
+            file_id: 指定文件时丢弃其排队中的中间进度（随后写入的终态会覆盖它），
+                只等待该文件的在途写入；为 None 时等待所有文件的排队进度写完
+        """
+        if file_id is None:
+            if self._progress_writers:
+                await asyncio.gather(*list(self._progress_writers.values()))
+            return
+        
+        self._queued_progress.pop(file_id, None)
+        writer = self._progress_writers.get(file_id)
+        if writer is not None:
+            await writer
+    
+    async def cleanup(self) -> None:
+        """清理资源：先落地后台进度写入，再执行父类清理"""
+        await self._flush_progress_writes()
+        await super().cleanup()
+    
     def get_stats(self) -> dict:
         """
         获取统计信息
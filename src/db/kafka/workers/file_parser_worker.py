@@ -11,6 +11,7 @@ FileParser Worker
   - knowledge_base.parse.end (解析完成消息)
 """
 
+import asyncio
 from typing import Optional, List, Dict, Any
 from loguru import logger
 
@@ -28,6 +29,9 @@ from src.types.messages.db_write import (
 from src.db.storage.manager import StorageManager
 from src.service.knowledge.components.file_parser_service import FileParserService
 
+# 单次 send_messages 的最大消息数：限制包装消息与待 ack Future 的峰值内存
+_SEND_CHUNK_SIZE = 500
+
 
 class FileParserWorker(BaseWorker):
     """
@@ -187,18 +191,22 @@ class FileParserWorker(BaseWorker):
                 f"elements_payload={len(elements_payload)}"
             )
             
-            # 3. 发送 MySQL 写入消息到 Kafka
-            if mysql_messages:
-                await self._send_mysql_messages(message, mysql_messages)
-            
-            # 4. 发送 MongoDB 写入消息到 Kafka
-            if mongodb_messages:
-                await self._send_mongodb_messages(message, mongodb_messages)
+            # 3. 并发发送 MySQL / MongoDB 写入消息到 Kafka（两路无数据依赖，
+            #    总耗时取两者较大值而非之和）。TaskGroup 在任一路失败时取消并等待另一路，
+            #    失败文件不会继续发出写入消息；首个异常交给外层 except 统一标记失败
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    if mysql_messages:
+                        tg.create_task(self._send_mysql_messages(message, mysql_messages))
+                    if mongodb_messages:
+                        tg.create_task(self._send_mongodb_messages(message, mongodb_messages))
+            except ExceptionGroup as eg:
+                raise eg.exceptions[0]
             
-            # 5. 发送解析完成消息（自包含 elements payload，供 split 阶段直接消费）
+            # 4. 发送解析完成消息（自包含 elements payload，供 split 阶段直接消费）
             await self._send_parse_end_message(message, parse_result, elements_payload)
             
-            # 6. 更新 Redis 进度到 parse_end (40%)
+            # 5. 更新 Redis 进度到 parse_end (40%)
             await self._update_file_progress(
                 file_id=message.file_id,
                 stage=IndexStage.PARSE_END,
@@ -276,19 +284,20 @@ class FileParserWorker(BaseWorker):
         
         logger.info(f"发送 {len(records)} 条 MySQL 消息到 Kafka")
         
-        # P2 #7：先组装全部消息，再批量发送（aiokafka 合并为更少的 broker 请求）
-        meta_msgs = [
-            MetaWriteMessage(
-                user_id=message.user_id,
-                file_id=message.file_id,
-                table_name=MySQLTable.ELEMENT_META_INFO,
-                record_data=record,
-                operation=WriteOperation.INSERT,
-                record_id=record.get("element_id", message.file_id),
-            )
-            for record in records
-        ]
-        if meta_msgs:
+        # P2 #7：按块组装并批量发送（aiokafka 合并为更少的 broker 请求）；
+        # 分块使包装消息的峰值内存与文档元素数无关
+        for start in range(0, len(records), _SEND_CHUNK_SIZE):
+            meta_msgs = [
+                MetaWriteMessage(
+                    user_id=message.user_id,
+                    file_id=message.file_id,
+                    table_name=MySQLTable.ELEMENT_META_INFO,
+                    record_data=record,
+                    operation=WriteOperation.INSERT,
+                    record_id=record.get("element_id", message.file_id),
+                )
+                for record in records[start:start + _SEND_CHUNK_SIZE]
+            ]
             await self._producer.send_messages(
                 topic=KafkaTopics.DB_WRITE_META,
                 messages=meta_msgs
@@ -316,19 +325,19 @@ class FileParserWorker(BaseWorker):
         
         logger.info(f"发送 {len(documents)} 条 MongoDB 消息到 Kafka")
         
-        # P2 #7：批量发送
-        mongo_msgs = [
-            MongoWriteMessage(
-                user_id=message.user_id,
-                file_id=message.file_id,
-                collection_name=MongoCollection.ELEMENT_DATA,
-                document_data=doc,
-                operation=WriteOperation.INSERT,
-                document_id=str(doc.get("_id", message.file_id)),
-            )
-            for doc in documents
-        ]
-        if mongo_msgs:
+        # P2 #7：按块批量发送
+        for start in range(0, len(documents), _SEND_CHUNK_SIZE):
+            mongo_msgs = [
+                MongoWriteMessage(
+                    user_id=message.user_id,
+                    file_id=message.file_id,
+                    collection_name=MongoCollection.ELEMENT_DATA,
+                    document_data=doc,
+                    operation=WriteOperation.INSERT,
+                    document_id=str(doc.get("_id", message.file_id)),
+                )
+                for doc in documents[start:start + _SEND_CHUNK_SIZE]
+            ]
             await self._producer.send_messages(
                 topic=KafkaTopics.DB_WRITE_MONGO,
                 messages=mongo_msgs
@@ -35,7 +35,7 @@ class MongoWriter(BaseWriter):
     - Flush Interval: 500ms
 
     优化策略:
-    - 批量 INSERT (batch_size=100)
+    - 批量 INSERT (batch_size=100, ordered=False)
     - 按 collection 分组 → 按 operation 分组
     - 使用 bulk_write 批量操作
 
@@ -250,10 +250,12 @@ class MongoWriter(BaseWriter):
         messages: List[MongoWriteMessage]
     ) -> List[bool]:
         """
-        批量 INSERT，失败时降级为逐条 INSERT（P0 #3 / P1 #4）
+        批量 INSERT（insert_many ordered=False，精确捕获部分失败）
 
-        create_batch 内部 insert_many 整批失败会抛异常，不会半写，
-        因此降级重试是安全的（无重复写入风险）。
+        无序插入时单条失败不会中断整批，其余文档照常写入；
+        BulkWriteError.writeErrors 携带失败条目的 index，据此精确标记每条消息成败，
+        避免 ordered 模式下“首条失败即中断、后续条目整体重试”的额外 round-trip。
+        无法定位失败 index 时降级为逐条 INSERT。
 
         Args:
             repo: Repository 实例
@@ -264,22 +266,39 @@ class MongoWriter(BaseWriter):
         """
         data_list = [msg.document_data for msg in messages]
         creator = messages[0].updater if messages else "system"
+        # 入库形态的可信数据跳过 Beanie 模型实例化与逐字段校验
+        insert_batch = repo.insert_raw_batch if repo.raw_insert_safe else repo.create_batch
 
         try:
-            await repo.create_batch(data_list, creator=creator)
+            await insert_batch(data_list, creator=creator, ordered=False)
             logger.debug(
                 f"批量 INSERT ({type(repo).__name__}): 成功 {len(messages)} 条"
             )
             return [True] * len(messages)
         except Exception as e:
+            failed_indices = self._extract_failed_indices(e)
+            if failed_indices is not None:
+                results = [True] * len(messages)
+                for idx in failed_indices:
+                    if 0 <= idx < len(messages):
+                        results[idx] = False
+                        logger.error(
+                            f"INSERT 单条失败 event_id={messages[idx].metadata.event_id} "
+                            f"collection={messages[idx].collection_name}: {e}"
+                        )
+                logger.warning(
+                    f"批量 INSERT 部分失败 ({type(repo).__name__}): "
+                    f"{len(failed_indices)}/{len(messages)} 条失败"
+                )
+                return results
             logger.warning(
-                f"批量 INSERT 失败 ({type(repo).__name__}, {len(messages)}条)，"
-                f"降级为逐条: {e}"
+                f"批量 INSERT 失败且无法定位条目 ({type(repo).__name__}, "
+                f"{len(messages)}条)，降级为逐条: {e}"
             )
             results: List[bool] = []
             for msg in messages:
                 try:
-                    await repo.create_batch([msg.document_data], creator=creator)
+                    await insert_batch([msg.document_data], creator=creator)
                     results.append(True)
                 except Exception as e2:
                     logger.error(
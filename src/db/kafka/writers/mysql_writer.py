@@ -37,7 +37,7 @@ class MySQLWriter(BaseWriter):
 
     优化策略:
     - 批量 INSERT/UPDATE (batch_size=200)
-    - 使用 executemany 批量操作
+    - INSERT 使用 Core executemany（不构造 ORM 实例）
     - 按表分组 → 按操作分组处理
 
     配置要求:
@@ -282,8 +282,8 @@ class MySQLWriter(BaseWriter):
         """
         批量 INSERT，失败时降级为逐条 INSERT（P0 #3 / P1 #4）
 
-        bulk_create 内部是单事务 add_all+commit，整批失败会 rollback，
-        因此降级重试是安全的（不会产生重复写入）。
+        bulk_insert 走 Core executemany（不构造 ORM 实例），单事务提交，
+        整批失败会 rollback，因此降级重试是安全的（不会产生重复写入）。
 
         Args:
             session: 数据库 Session
@@ -294,10 +294,8 @@ class MySQLWriter(BaseWriter):
             每条消息的成功标志
         """
         batch_data = [msg.record_data for msg in messages]
-        result = repo.bulk_create(session, batch_data)
 
-        # bulk_create 成功返回等长列表；失败返回 []（已 rollback）
-        if len(result) == len(messages):
+        if repo.bulk_insert(session, batch_data):
             logger.debug(
                 f"批量 INSERT ({type(repo).__name__}): 成功 {len(messages)} 条"
             )
@@ -309,9 +307,9 @@ class MySQLWriter(BaseWriter):
         )
         results: List[bool] = []
         for msg in messages:
-            single = repo.bulk_create(session, [msg.record_data])
-            results.append(len(single) == 1)
-            if len(single) != 1:
+            ok = repo.bulk_insert(session, [msg.record_data])
+            results.append(ok)
+            if not ok:
                 logger.error(
                     f"单条 INSERT 失败 event_id={msg.metadata.event_id} "
                     f"table={msg.table_name}"
@@ -42,8 +42,14 @@ class BaseRepository(Generic[DocumentType]):
     - count: 统计记录数
     
     使用泛型确保类型安全。
+    
+    子类若写入的数据本身已是入库形态（字段名即存储键、无需类型转换），
+    可将 raw_insert_safe 置为 True，允许写入方走 insert_raw_batch 跳过模型校验。
     """
     
+    # 数据是否可跳过 Beanie 模型校验直接入库（见 insert_raw_batch）
+    raw_insert_safe: bool = False
+    
     def __init__(self, model: Type[DocumentType]):
         """
         初始化 Repository
@@ -104,7 +110,8 @@ class BaseRepository(Generic[DocumentType]):
     async def create_batch(
         self,
         data_list: List[Dict[str, Any]],
-        creator: str = ""
+        creator: str = "",
+        ordered: bool = True
     ) -> List[DocumentType]:
         """
         批量创建记录
@@ -112,6 +119,8 @@ class BaseRepository(Generic[DocumentType]):
         Args:
             data_list: 数据列表，每个元素是字典
             creator: 创建者
+            ordered: 是否有序插入。False 时服务端不会因单条失败中断整批，
+                其余文档照常写入，失败条目通过 BulkWriteError.details 返回
             
         Returns:
             创建的文档实例列表
@@ -136,7 +145,7 @@ class BaseRepository(Generic[DocumentType]):
             
             # 批量插入
             # 注意：insert_many 会更新文档实例的 ID
-            insert_result = await self.model.insert_many(documents)
+            insert_result = await self.model.insert_many(documents, ordered=ordered)
             
             # 验证插入结果
             if insert_result and hasattr(insert_result, 'inserted_ids'):
@@ -152,6 +161,50 @@ class BaseRepository(Generic[DocumentType]):
             self.logger.error(f"批量创建{self.model_name}记录失败: {repr(e)}", exc_info=True)
             raise
     
+    async def insert_raw_batch(
+        self,
+        data_list: List[Dict[str, Any]],
+        creator: str = "",
+        ordered: bool = True
+    ) -> List[Any]:
+        """
+        批量插入原始文档（跳过 Beanie 模型实例化与校验）
+        
+        直接以 dict 调用底层集合的 insert_many，省去每条文档的 Pydantic
+        校验与 get_dict 序列化。仅适用于内部构建、已是入库形态的可信数据
+        （键名与存储字段一致，如 "_id"），调用方需自行保证结构正确。
+        
+        Args:
+            data_list: 文档字典列表
+            creator: 创建者
+            ordered: 是否有序插入（同 create_batch）
+            
+        Returns:
+            插入的文档ID列表
+        """
+        if not data_list:
+            return []
+        
+        try:
+            now = datetime.now()
+            for data in data_list:
+                data["creator"] = creator
+                data["updater"] = creator
+                data.setdefault("create_time", now)
+                data.setdefault("update_time", now)
+                data.setdefault("deleted", 0)
+                data.setdefault("status", 0)
+            
+            collection = self.model.get_pymongo_collection()
+            insert_result = await collection.insert_many(data_list, ordered=ordered)
+            
+            self.logger.debug(f"成功批量插入{len(data_list)}个{self.model_name}原始文档")
+            return list(insert_result.inserted_ids)
+        
+        except Exception as e:
+            self.logger.error(f"批量插入{self.model_name}原始文档失败: {repr(e)}", exc_info=True)
+            raise
+    
     # ========== 查询操作 ==========
     
     async def get_by_id(
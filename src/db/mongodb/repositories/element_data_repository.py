@@ -22,6 +22,9 @@ from src.db.mongodb.models.element_data import ElementData
 class ElementDataRepository(BaseRepository[ElementData]):
     """ElementData Repository"""
     
+    # FileParserService 构建的 {"_id", "type", "content"} 已是入库形态
+    raw_insert_safe = True
+    
     def __init__(self):
         """初始化 ElementDataRepository"""
         super().__init__(ElementData)
@@ -15,6 +15,7 @@
 from typing import TypeVar, Generic, Type, Optional, List, Dict, Any
 from datetime import datetime
 from loguru import logger
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.dialects.mysql import insert as mysql_insert
@@ -31,6 +32,7 @@ class BaseRepository(Generic[ModelType]):
     提供通用的 CRUD 操作：
     - create: 创建单条记录
     - bulk_create: 批量创建记录
+    - bulk_insert: 批量插入（Core executemany，不构造 ORM 实例）
     - get_by_id: 根据主键查询
     - get_all: 查询所有记录（未删除）
     - update: 更新记录
@@ -126,6 +128,58 @@ class BaseRepository(Generic[ModelType]):
             logger.error(f"批量创建{self.model_name}记录失败: {e}")
             return []
     
+    def bulk_insert(
+        self,
+        session: Session,
+        rows: List[Dict[str, Any]],
+        chunk_size: int = 500
+    ) -> bool:
+        """
+        批量插入（Core insert + executemany，单事务提交）
+
+        与 bulk_create 相比不实例化 ORM 对象、不走 unit-of-work flush，
+        也不逐条 refresh 回读；SQLAlchemy 2.0 的 insertmanyvalues 会把每个
+        分块合并为一条多值 INSERT。列上的 Python 端 default（审计字段等）照常生效。
+        适用于写入后无需回读实例的场景（如 Kafka Writer）。
+
+        Args:
+            session: 数据库会话
+            rows: 行数据列表，键为列名；各行键集合可以不同（按键集合分组插入）
+            chunk_size: 每条 INSERT 语句的最大行数，避免超过 max_allowed_packet
+
+        Returns:
+            全部写入成功返回 True；失败已 rollback 并返回 False
+
+        Examples:
+            >>> repo = BaseRepository(ElementMetaInfo)
+            >>> ok = repo.bulk_insert(session, [
+            ...     {"element_id": "element-1", "element_type": "text"},
+            ...     {"element_id": "element-2", "element_type": "table"}
+            ... ])
+        """
+        if not rows:
+            return True
+
+        # executemany 的列集合取自首行，后续行多出的键会被静默丢弃
+        # （如只有图片 chunk 才带 image_file_* 字段），因此按键集合分组，每组单独插入；
+        # 组内缺省的列仍由列 default 填充，而不是被显式写成 NULL
+        groups: Dict[frozenset, List[Dict[str, Any]]] = {}
+        for row in rows:
+            groups.setdefault(frozenset(row), []).append(row)
+
+        try:
+            stmt = insert(self.model.__table__)
+            for group in groups.values():
+                for start in range(0, len(group), chunk_size):
+                    session.execute(stmt, group[start:start + chunk_size])
+            session.commit()
+            logger.debug(f"成功 bulk_insert {len(rows)} 条 {self.model_name}")
+            return True
+        except SQLAlchemyError as e:
+            session.rollback()
+            logger.error(f"{self.model_name} bulk_insert 失败({len(rows)}条): {e}")
+            return False
+
     def get_by_id(
         self, 
         session: Session, 
@@ -60,6 +60,41 @@ class WorkspaceFileSystemRepository(BaseRepository[WorkspaceFileSystem]):
             logger.error(f"查询WorkspaceFileSystem失败: {e}")
             return None
     
+    def get_by_user_and_files(
+        self,
+        session: Session,
+        user_id: str,
+        file_ids: List[str]
+    ) -> List[WorkspaceFileSystem]:
+        """根据多个 file_id 批量查询文件（批量进度查询 MySQL fallback 使用）
+
+        与 ``get_by_user_and_file`` 区别：一次 ``IN`` 查询取回全部文件，避免 N+1 查询。
+
+        Args:
+            session: 数据库会话
+            user_id: 用户ID
+            file_ids: 文件 ID 列表；空列表直接返回 ``[]``
+
+        Returns:
+            WorkspaceFileSystem 列表（deleted=0；未找到的 file_id 不出现在结果中）
+        """
+        if not file_ids:
+            return []
+        try:
+            results = session.query(self.model).filter(
+                self.model.user_id == user_id,
+                self.model.file_id.in_(file_ids),
+                self.model.deleted == 0,
+            ).all()
+            logger.debug(
+                f"批量按 file_ids 查询文件: user_id={user_id}, "
+                f"requested={len(file_ids)}, found={len(results)}"
+            )
+            return results
+        except SQLAlchemyError as e:
+            logger.error(f"批量按 file_ids 查询失败: {e}")
+            return []
+
     def get_by_user_id(
         self,
         session: Session,
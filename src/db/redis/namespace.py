@@ -65,6 +65,8 @@ class RedisNamespace:
         self.manager = manager
         self.namespace = namespace
         self.separator = separator
+        # key 前缀只拼接一次，_make_key / _make_keys 直接复用
+        self._prefix = f"{namespace}{separator}"
         
         logger.debug(f"创建 Redis 命名空间: {namespace}")
     
@@ -78,7 +80,7 @@ class RedisNamespace:
         Returns:
             带命名空间前缀的完整 key
         """
-        return f"{self.namespace}{self.separator}{key}"
+        return self._prefix + key
     
     def _make_keys(self, keys: List[str]) -> List[str]:
         """
@@ -90,7 +92,8 @@ class RedisNamespace:
         Returns:
             带命名空间前缀的完整 key 列表
         """
-        return [self._make_key(key) for key in keys]
+        prefix = self._prefix
+        return [prefix + key for key in keys]
     
     # ==================== 字符串操作 ====================
     
@@ -247,6 +250,54 @@ class RedisNamespace:
         full_key = self._make_key(key)
         return await self.manager.execute("HGETALL", full_key)
     
+    async def hset_with_expire(
+        self,
+        key: str,
+        mapping: Dict[str, Any],
+        seconds: int
+    ) -> int:
+        """
+        批量设置哈希表字段并刷新过期时间
+        
+        HSET 与 EXPIRE 通过 MULTI/EXEC 事务一次往返提交，两条命令原子生效，
+        不会出现字段已写入但未设置过期时间的键。
+        
+        Args:
+            key: 键名
+            mapping: 字段值字典
+            seconds: 过期时间（秒）
+        
+        Returns:
+            新增的字段数量
+        """
+        full_key = self._make_key(key)
+        async with self.manager.get_connection() as conn:
+            pipe = conn.pipeline(transaction=True)
+            pipe.hset(full_key, mapping=mapping)
+            pipe.expire(full_key, seconds)
+            added, _ = await pipe.execute()
+        return added
+    
+    async def hgetall_many(self, keys: List[str]) -> List[Dict[str, str]]:
+        """
+        批量获取多个哈希表的所有字段和值
+        
+        多个 HGETALL 通过 pipeline 一次往返提交。
+        
+        Args:
+            keys: 键名列表
+        
+        Returns:
+            与 keys 同序的字段值字典列表（不存在的键为空字典）
+        """
+        if not keys:
+            return []
+        async with self.manager.get_connection() as conn:
+            pipe = conn.pipeline(transaction=False)
+            for full_key in self._make_keys(keys):
+                pipe.hgetall(full_key)
+            return await pipe.execute()
+    
     async def hdel(self, key: str, *fields: str) -> int:
         """
         删除哈希表字段
@@ -647,7 +698,7 @@ class RedisNamespace:
         full_keys = await self.manager.execute("KEYS", full_pattern)
         
         # 移除命名空间前缀
-        prefix_len = len(self.namespace) + len(self.separator)
+        prefix_len = len(self._prefix)
         return [key[prefix_len:] for key in full_keys]
     
     # ==================== 命名空间管理 ====================
@@ -667,7 +718,7 @@ class RedisNamespace:
             user_profile = user_redis.sub_namespace("profile")
             # user_profile 的命名空间为 "user:profile"
         """
-        new_namespace = f"{self.namespace}{self.separator}{sub_ns}"
+        new_namespace = self._prefix + sub_ns
         return RedisNamespace(self.manager, new_namespace, self.separator)
     
     def get_full_key(self, key: str) -> str:
@@ -692,7 +743,7 @@ class RedisNamespace:
             删除的键数量
         """
         # 获取命名空间下的所有 key
-        pattern = f"{self.namespace}{self.separator}*"
+        pattern = self._prefix + "*"
         keys = await self.manager.execute("KEYS", pattern)
         
         if not keys:
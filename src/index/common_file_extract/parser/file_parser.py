@@ -12,6 +12,8 @@
 @Copyright：Copyright(c) 2024-2026. All Rights Reserved
 =================================================="""
 
+import asyncio
+from functools import lru_cache
 from typing import Dict, Optional, Union
 from pathlib import Path
 
@@ -41,39 +43,27 @@ class FileParser:
     - ❌ 文件下载（由 FileParserService 负责）
     """
     
-    # 支持的文件扩展名映射
+    # 支持的文件扩展名映射（统一小写，检测时对后缀做 lower() 归一化）
     SUPPORTED_EXTENSIONS = {
         # PDF
         '.pdf': 'pdf',
-        '.PDF': 'pdf',
         # Word
         '.docx': 'word',
-        '.DOCX': 'word',
         '.doc': 'word',
-        '.DOC': 'word',
         # Excel
         '.xlsx': 'excel',
-        '.XLSX': 'excel',
         '.xls': 'excel',
-        '.XLS': 'excel',
         # PowerPoint
         '.pptx': 'ppt',
-        '.PPTX': 'ppt',
         '.ppt': 'ppt',
-        '.PPT': 'ppt',
         # 文本
         '.txt': 'txt',
-        '.TXT': 'txt',
         # Markdown
         '.md': 'markdown',
-        '.MD': 'markdown',
         '.markdown': 'markdown',
-        '.MARKDOWN': 'markdown',
         # 数据
         '.json': 'json',
-        '.JSON': 'json',
         '.csv': 'csv',
-        '.CSV': 'csv',
     }
     
     @staticmethod
@@ -90,9 +80,23 @@ class FileParser:
         Raises:
             ValueError: 不支持的文件类型
         """
-        file_path = Path(file_path)
-        suffix = file_path.suffix
+        return FileParser._file_type_for_suffix(Path(file_path).suffix.lower())
+    
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _file_type_for_suffix(suffix: str) -> str:
+        """
+        后缀 → 文件类型（按小写后缀缓存；不支持的后缀抛异常，不进入缓存）
         
+        Args:
+            suffix: 小写文件后缀，如 ".pdf"
+            
+        Returns:
+            str: 文件类型
+            
+        Raises:
+            ValueError: 不支持的文件类型
+        """
         if suffix not in FileParser.SUPPORTED_EXTENSIONS:
             supported_types = list(set(FileParser.SUPPORTED_EXTENSIONS.values()))
             raise ValueError(
@@ -105,7 +109,8 @@ class FileParser:
     @staticmethod
     async def parse(
         file_path: Union[str, Path],
-        file_name: Optional[str] = None
+        file_name: Optional[str] = None,
+        file_bytes: Optional[bytes] = None
     ) -> Dict:
         """
         通用文件解析入口（静态方法）
@@ -113,6 +118,8 @@ class FileParser:
         Args:
             file_path: 文件路径
             file_name: 文件名（可选，如果不提供则从 file_path 提取）
+            file_bytes: 文件字节内容（可选，调用方已持有时传入，
+                PDF 解析直接复用，避免从 file_path 再读一份到内存）
             
         Returns:
             Dict: 解析结果
@@ -143,7 +150,7 @@ class FileParser:
             
             # 2. 根据文件类型路由到对应解析器
             if file_type == "pdf":
-                parse_result = await FileParser._parse_pdf(file_path, file_name)
+                parse_result = await FileParser._parse_pdf(file_path, file_name, file_bytes)
             elif file_type == "word":
                 parse_result = await FileParser._parse_word(file_path, file_name)
             elif file_type == "excel":
@@ -180,13 +187,18 @@ class FileParser:
     # ========== 私有解析方法（懒加载 Parser）==========
     
     @staticmethod
-    async def _parse_pdf(file_path: Path, file_name: str) -> Dict:
+    async def _parse_pdf(
+        file_path: Path,
+        file_name: str,
+        file_bytes: Optional[bytes] = None
+    ) -> Dict:
         """
         解析 PDF 文件
         
         Args:
             file_path: 文件路径
             file_name: 文件名
+            file_bytes: 文件字节内容（可选，已持有时复用）
             
         Returns:
             Dict: 解析结果
@@ -195,11 +207,13 @@ class FileParser:
         from src.client.mineru import Mineru2Client
         from src.utils.config_manager import get_config_manager
         
-        # 懒加载：创建 Mineru 客户端
+        # 懒加载：创建 Mineru 客户端（连接池大小与分页并发数一致）
         config = get_config_manager()
+        max_concurrent_requests = config.get("mineru.max_concurrent_requests", 5)
         mineru_config = {
             "api_url": config.get("mineru.api_url", "http://localhost:18000"),
-            "timeout": config.get("mineru.timeout", 300)
+            "timeout": config.get("mineru.timeout", 300),
+            "pool_maxsize": max_concurrent_requests
         }
         mineru_client = Mineru2Client(mineru_config=mineru_config)
         
@@ -207,11 +221,14 @@ class FileParser:
         pdf_parser = PDFParser(
             mineru_client=mineru_client,
             max_pages_per_request=config.get("mineru.max_pages_per_request", 2),
-            max_concurrent_requests=config.get("mineru.max_concurrent_requests", 5)
+            max_concurrent_requests=max_concurrent_requests
         )
         
         # 调用解析
-        return await pdf_parser.parse(file_path, file_name)
+        try:
+            return await pdf_parser.parse(file_path, file_name, file_bytes=file_bytes)
+        finally:
+            mineru_client.close()
     
     @staticmethod
     async def _parse_word(file_path: Path, file_name: str) -> Dict:
@@ -387,28 +404,33 @@ class FileParser:
     
     @staticmethod
     async def parse_multiple(
-        file_paths: list[Union[str, Path]]
+        file_paths: list[Union[str, Path]],
+        max_concurrent_files: int = 3
     ) -> list[Dict]:
         """
-        批量解析多个文件
+        批量解析多个文件（有界并发）
+        
+        解析耗时主要在 MinerU 的 HTTP 往返上，多个文件并发执行可重叠 I/O 等待；
+        使用信号量限制同时解析的文件数，避免压垮 MinerU 服务。
         
         Args:
             file_paths: 文件路径列表
+            max_concurrent_files: 最大并发解析文件数
             
         Returns:
-            list[Dict]: 解析结果列表
+            list[Dict]: 解析结果列表（与 file_paths 同序）
         """
-        results = []
-        
-        for file_path in file_paths:
-            try:
-                result = await FileParser.parse(file_path)
-                results.append(result)
-            except Exception as e:
-                results.append({
-                    "status": "failed",
-                    "file_name": Path(file_path).name,
-                    "error": str(e)
-                })
-        
-        return results
+        sem = asyncio.Semaphore(max_concurrent_files)
+        
+        async def _run(file_path: Union[str, Path]) -> Dict:
+            async with sem:
+                try:
+                    return await FileParser.parse(file_path)
+                except Exception as e:
+                    return {
+                        "status": "failed",
+                        "file_name": Path(file_path).name,
+                        "error": str(e)
+                    }
+        
+        return await asyncio.gather(*[_run(p) for p in file_paths])
@@ -14,10 +14,11 @@
 
 from typing import Dict, Optional, Union, List
 from pathlib import Path
+from io import BytesIO
 import asyncio
 
 from loguru import logger
-from pypdf import PdfReader
+from pypdf import PdfReader, PdfWriter
 
 from src.client.mineru import Mineru2Client
 
@@ -67,7 +68,21 @@ class PDFParser:
         :raises Exception: 读取失败时抛出异常
         """
         try:
-            reader = PdfReader(str(file_path))
+            reader = PdfReader(str(file_path), strict=False)
+            return len(reader.pages)
+        except Exception as e:
+            raise Exception(f"获取 PDF 页数失败: {e}")
+    
+    def get_pdf_pages_from_bytes(self, file_bytes: bytes) -> int:
+        """
+        从已读取的字节内容获取 PDF 总页数（避免再次读盘）
+        
+        :param file_bytes: PDF 文件字节内容
+        :return: 总页数
+        :raises Exception: 读取失败时抛出异常
+        """
+        try:
+            reader = PdfReader(BytesIO(file_bytes), strict=False)
             return len(reader.pages)
         except Exception as e:
             raise Exception(f"获取 PDF 页数失败: {e}")
@@ -86,10 +101,62 @@ class PDFParser:
         except Exception as e:
             raise Exception(f"读取文件失败: {e}")
     
+    def _slice_pdf(
+        self,
+        source: Union[bytes, PdfReader],
+        start_page: int,
+        end_page: int
+    ) -> bytes:
+        """
+        截取 PDF 指定页码范围，生成只包含这些页的子 PDF
+        
+        分页请求只上传本批次的页面，避免每个批次都重复上传整个文件。
+        
+        :param source: 已解析的 PdfReader（多批次复用），或原始 PDF 字节内容
+        :param start_page: 起始页码（从0开始）
+        :param end_page: 结束页码（包含）
+        :return: 子 PDF 字节内容
+        """
+        reader = source if isinstance(source, PdfReader) else PdfReader(BytesIO(source))
+        writer = PdfWriter()
+        for page in reader.pages[start_page:end_page + 1]:
+            writer.add_page(page)
+        output = BytesIO()
+        writer.write(output)
+        return output.getvalue()
+    
+    def _slice_pdf_ranges(
+        self,
+        file_bytes: bytes,
+        page_ranges: List[tuple]
+    ) -> List[Optional[bytes]]:
+        """
+        只解析一次 PDF，从同一个 PdfReader 截取所有批次的子 PDF
+        
+        :param file_bytes: 原始 PDF 字节内容
+        :param page_ranges: 页面范围列表 [(start_page, end_page), ...]
+        :return: 与 page_ranges 一一对应的子 PDF 字节内容，截取失败的批次为 None
+        """
+        try:
+            reader = PdfReader(BytesIO(file_bytes))
+        except Exception as e:
+            self.logger.warning(f"⚠️ 解析 PDF 失败，所有批次回退整文件上传: {e}")
+            return [None] * len(page_ranges)
+        
+        slices: List[Optional[bytes]] = []
+        for idx, (start_page, end_page) in enumerate(page_ranges, 1):
+            try:
+                slices.append(self._slice_pdf(reader, start_page, end_page))
+            except Exception as e:
+                self.logger.warning(f"⚠️ 批次{idx}截取 PDF 失败，回退整文件上传: {e}")
+                slices.append(None)
+        return slices
+    
     async def parse(
         self, 
         file_path: Union[str, Path],
-        file_name: Optional[str] = None
+        file_name: Optional[str] = None,
+        file_bytes: Optional[bytes] = None
     ) -> Dict:
         """
         解析 PDF 文件
@@ -100,6 +167,8 @@ class PDFParser:
         
         :param file_path: PDF 文件路径
         :param file_name: 文件名（可选，不传则从路径提取）
+        :param file_bytes: 文件字节内容（可选，调用方已持有时传入则不再读盘，
+            避免同一文件在进程内存中出现两份完整拷贝）
         :return: 解析结果字典
         
         返回格式：
@@ -137,12 +206,13 @@ class PDFParser:
         self.logger.info(f"📄 开始解析 PDF: {file_name}")
         
         try:
-            # 1. 读取文件字节
-            file_bytes = self.read_file_bytes(file_path)
-            self.logger.debug(f"✅ 文件读取成功: {len(file_bytes)} 字节")
+            # 1. 读取文件字节（调用方已传入则直接复用）
+            if file_bytes is None:
+                file_bytes = self.read_file_bytes(file_path)
+                self.logger.debug("✅ 文件读取成功: {} 字节", len(file_bytes))
             
-            # 2. 获取总页数
-            total_pages = self.get_pdf_pages(file_path)
+            # 2. 获取总页数（复用已读取的字节，不再重复读盘）
+            total_pages = self.get_pdf_pages_from_bytes(file_bytes)
             self.logger.info(f"📖 PDF 总页数: {total_pages}")
             
             # 3. 判断是否需要分页
@@ -213,56 +283,91 @@ class PDFParser:
         :param total_pages: 总页数
         :return: 合并后的解析结果
         """
-        # 1. 创建页面范围列表
-        page_ranges = []
-        for start_page in range(0, total_pages, self.max_pages_per_request):
-            end_page = min(start_page + self.max_pages_per_request - 1, total_pages - 1)
-            page_ranges.append((start_page, end_page))
+        # 1. 一次性生成页面范围元组：结束页为下一批次起点减一，最后一批截断到末页
+        step = self.max_pages_per_request
+        starts = range(0, total_pages, step)
+        page_ranges = list(zip(starts, [s - 1 for s in starts[1:]] + [total_pages - 1]))
         
         self.logger.info(f"📋 分页方案: {len(page_ranges)} 个批次")
+        # 逐批次 debug 日志使用 loguru 位置参数，级别被过滤时不做字符串格式化
         for idx, (start, end) in enumerate(page_ranges, 1):
-            self.logger.debug(f"   批次{idx}: 页码 {start}-{end}")
+            self.logger.debug("   批次{}: 页码 {}-{}", idx, start, end)
+        
+        # 2. 只解析一次 PDF，截取所有批次的子 PDF（同步操作，在 executor 中运行）
+        loop = asyncio.get_running_loop()
+        range_slices = await loop.run_in_executor(
+            None, self._slice_pdf_ranges, file_bytes, page_ranges
+        )
         
-        # 2. 创建信号量控制并发数
+        # 3. 创建信号量控制并发数
         semaphore = asyncio.Semaphore(self.max_concurrent_requests)
         
         async def process_page_range(start_page: int, end_page: int, batch_index: int):
             """处理单个页面范围"""
             async with semaphore:
-                self.logger.debug(f"🔄 开始处理批次{batch_index}: 页码 {start_page}-{end_page}")
+                self.logger.debug("🔄 开始处理批次{}: 页码 {}-{}", batch_index + 1, start_page, end_page)
                 
-                # Mineru2Client.parse_file 是同步方法，需要在 executor 中运行
-                loop = asyncio.get_running_loop()
-                result = await loop.run_in_executor(
-                    None,
-                    lambda: self.mineru_client.parse_file(
-                        file_bytes=file_bytes,
+                def parse_range() -> Dict:
+                    # 只上传本批次页面；截取失败时回退为整文件 + 页码范围
+                    range_bytes = range_slices[batch_index]
+                    if range_bytes is None:
+                        return self.mineru_client.parse_file(
+                            file_bytes=file_bytes,
+                            file_name=file_name,
+                            start_page_id=start_page,
+                            end_page_id=end_page
+                        )
+                    return self.mineru_client.parse_file(
+                        file_bytes=range_bytes,
                         file_name=file_name,
-                        start_page_id=start_page,
-                        end_page_id=end_page
+                        start_page_id=0,
+                        end_page_id=end_page - start_page
                     )
-                )
                 
-                self.logger.debug(f"✅ 批次{batch_index}完成")
+                # Mineru2Client.parse_file 为同步操作，需要在 executor 中运行
+                result = await loop.run_in_executor(None, parse_range)
+                
+                self.logger.debug("✅ 批次{}完成", batch_index + 1)
                 return batch_index, result
         
-        # 3. 并发执行所有批次
+        # 4. 并发执行所有批次
         tasks = [
-            process_page_range(start, end, idx)
-            for idx, (start, end) in enumerate(page_ranges, 1)
+            asyncio.create_task(process_page_range(start, end, idx))
+            for idx, (start, end) in enumerate(page_ranges)
         ]
         
         self.logger.info(f"🚀 开始并发处理（最大并发数: {self.max_concurrent_requests}）")
-        results_with_index = await asyncio.gather(*tasks)
         
-        # 4. 按批次索引排序
-        sorted_results = [result for _, result in sorted(results_with_index, key=lambda x: x[0])]
-        
-        # 5. 合并结果
-        self.logger.info(f"🔗 合并 {len(sorted_results)} 个批次的结果")
-        merged_result = self._merge_results(sorted_results, page_ranges)
+        # 5. 边完成边合并：按批次顺序占槽，前缀批次就绪即并入结果，
+        #    合并工作与仍在进行的 MinerU 请求重叠，最后一个批次返回即完成
+        slots: List[Optional[Dict]] = [None] * len(page_ranges)
+        next_emit = 0
+        root: List[Dict] = []
+        md_contents: List[str] = []
+        try:
+            for finished in asyncio.as_completed(tasks):
+                batch_index, result = await finished
+                slots[batch_index] = result
+                while next_emit < len(slots) and slots[next_emit] is not None:
+                    self._append_batch(
+                        slots[next_emit], page_ranges[next_emit][0], root, md_contents
+                    )
+                    slots[next_emit] = None
+                    next_emit += 1
+        except BaseException:
+            # 任一批次失败（或自身被取消）时取消其余批次并等待其结束，避免遗留后台任务
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
         
-        return merged_result
+        self.logger.info(f"🔗 已合并 {len(page_ranges)} 个批次的结果")
+        return {
+            "status": "success",
+            "struct_content": {"root": root},
+            "content": "\n\n".join(md_contents),
+            "total_pages": len(root)
+        }
     
     def _merge_results(
         self, 
@@ -286,30 +391,39 @@ class PDFParser:
             self._fix_page_indices(results[0], page_ranges[0][0])
             return results[0]
         
-        merged = {
+        # 单次遍历：修正页码、拼接页面、收集非空 markdown
+        root: List[Dict] = []
+        md_contents: List[str] = []
+        for result, (start_page, _) in zip(results, page_ranges):
+            self._append_batch(result, start_page, root, md_contents)
+        
+        return {
             "status": "success",
-            "struct_content": {"root": []},
-            "content": "",
-            "total_pages": 0
+            "struct_content": {"root": root},
+            "content": "\n\n".join(md_contents),
+            "total_pages": len(root)
         }
+    
+    def _append_batch(
+        self,
+        result: Dict,
+        start_page: int,
+        root: List[Dict],
+        md_contents: List[str]
+    ) -> None:
+        """
+        将单个批次结果并入合并结构：修正页码、拼接页面、收集非空 markdown
         
-        for result, (start_page, _) in zip(results, page_ranges):
-            root_pages = result.get("struct_content", {}).get("root", [])
-            for page in root_pages:
-                batch_page_idx = page.get("page_idx", 0)
-                actual_page_idx = start_page + batch_page_idx
-                page["page_idx"] = actual_page_idx
-                for element in page.get("page_info", []):
-                    if "page_idx" in element:
-                        element["page_idx"] = actual_page_idx
-            merged["struct_content"]["root"].extend(root_pages)
-        
-        md_contents = [r.get("content", "") for r in results]
-        merged["content"] = "\n\n".join(filter(None, md_contents))
-        
-        merged["total_pages"] = len(merged["struct_content"]["root"])
-        
-        return merged
+        :param result: 单个批次的解析结果
+        :param start_page: 该批次在原文档中的起始页码
+        :param root: 合并后的页面列表（原地追加）
+        :param md_contents: 合并后的 markdown 片段列表（原地追加）
+        """
+        self._fix_page_indices(result, start_page)
+        root.extend(result.get("struct_content", {}).get("root", []))
+        content = result.get("content")
+        if content:
+            md_contents.append(content)
     
     def _fix_page_indices(self, result: Dict, start_page: int) -> None:
         """
@@ -12,6 +12,11 @@
 @Copyright：Copyright(c) 2024-2026. All Rights Reserved
 =================================================="""
 
+import re
+from functools import lru_cache
+from string import Formatter
+from typing import List, Optional, Sequence, Tuple
+
 language_translation_system_prompt = """
 # Role: Specialized Language Text Translation Assistant
 
@@ -105,4 +110,157 @@ Translate the content strictly following the system rules.
 </source_text>
 
 **Output:**
-"""
\ No newline at end of file
+"""
+
+
+# 多段打包翻译的用户提示词：把多个短文本用 <<<PAGE_k>>> / <<<END_k>>> 分隔符打包进
+# 同一次请求，系统提示词保持不变（与单段翻译共享可缓存的前缀）
+language_translation_packed_user_prompt = """
+# Task
+Translate the content strictly following the system rules.
+
+The input contains several independent segments. Each segment starts with a line `<<<PAGE_k>>>` and ends with a line `<<<END_k>>>`.
+- Translate every segment independently.
+- Keep every `<<<PAGE_k>>>` and `<<<END_k>>>` marker line exactly as is, each on its own line, in the original order.
+- Do not merge, drop, or add segments.
+
+**Input Text:**
+<source_text>
+{input_text}
+</source_text>
+
+**Output:**
+"""
+
+
+_PACKED_SEGMENT_RE = re.compile(r"<<<PAGE_(\d+)>>>\n(.*?)\n<<<END_\1>>>", re.DOTALL)
+
+
+def build_packed_translation_input(texts: Sequence[str]) -> str:
+    """
+    把多个待翻译文本按分隔符协议打包为一段输入
+
+    Args:
+        texts: 待翻译文本列表
+
+    Returns:
+        打包后的文本（填入 language_translation_packed_user_prompt 的 input_text）
+    """
+    return "\n\n".join(
+        f"<<<PAGE_{k}>>>\n{text}\n<<<END_{k}>>>" for k, text in enumerate(texts)
+    )
+
+
+def parse_packed_translation_output(content: str, count: int) -> Optional[List[str]]:
+    """
+    按分隔符协议拆分打包翻译的模型输出
+
+    Args:
+        content: 模型输出（已去除外层代码块包裹）
+        count: 打包的文本数量
+
+    Returns:
+        按原顺序排列的译文列表；分段缺失、重复或多出时返回 None
+    """
+    segments = _PACKED_SEGMENT_RE.findall(content)
+    if [int(k) for k, _ in segments] != list(range(count)):
+        return None
+    return [segment for _, segment in segments]
+
+
+# 提示词缓存标记：系统提示词（同一目标语言下内容固定）放在前面并标记为可缓存，
+# 每次变化的待翻译文本放在其后的 user 消息中（静态在前、动态在后）。
+# 作为 LiteLLM 的 cache_control_injection_points 参数透传，仅对支持显式缓存的
+# provider（如 Anthropic）注入 cache_control，OpenAI / Gemini 等按前缀自动缓存
+language_translation_cache_control_injection_points = [
+    {"location": "message", "role": "system"},
+]
+
+
+# 系统提示词模板在模块加载时预解析为 (字面量, 占位符) 片段，
+# 渲染时只做片段拼接，不再对整段多 KB 模板重复执行 str.format 解析
+_SYSTEM_PROMPT_SEGMENTS = tuple(
+    (literal_text, field_name)
+    for literal_text, field_name, _, _ in Formatter().parse(language_translation_system_prompt)
+)
+
+
+@lru_cache(maxsize=32)
+def render_language_translation_system_prompt(
+    target_language_code: str,
+    target_language_name: str,
+) -> str:
+    """
+    渲染翻译系统提示词（等价于 language_translation_system_prompt.format(...)）。
+    按目标语言缓存渲染结果，同一语言的后续调用直接复用同一字符串。
+
+    Args:
+        target_language_code: 目标语言代码（如 zh-CN）
+        target_language_name: 目标语言名称（如 Simplified Chinese）
+
+    Returns:
+        填充目标语言后的系统提示词
+    """
+    values = {
+        "TARGET_LANGUAGE_CODE": target_language_code,
+        "TARGET_LANGUAGE_NAME": target_language_name,
+    }
+    return "".join(
+        literal_text + (values[field_name] if field_name is not None else "")
+        for literal_text, field_name in _SYSTEM_PROMPT_SEGMENTS
+    )
+
+
+def _split_input_template(template: str) -> Tuple[str, str]:
+    """
+    把只含 {input_text} 一个占位符的模板预拆为 (前缀, 后缀)
+
+    Args:
+        template: 用户提示词模板
+
+    Returns:
+        (占位符之前的文本, 占位符之后的文本)，已按 str.format 规则处理 {{ }} 转义
+    """
+    parts = ["", ""]
+    index = 0
+    for literal_text, field_name, _, _ in Formatter().parse(template):
+        parts[index] += literal_text
+        if field_name is not None:
+            if field_name != "input_text" or index == 1:
+                raise ValueError(f"用户提示词模板只允许一个 {{input_text}} 占位符: {field_name}")
+            index = 1
+    return parts[0], parts[1]
+
+
+# 用户提示词模板预拆为前后缀，渲染时直接拼接待翻译文本，
+# 不再对每次请求的长文本执行 str.format 扫描
+_USER_PROMPT_PREFIX, _USER_PROMPT_SUFFIX = _split_input_template(language_translation_user_prompt)
+_PACKED_USER_PROMPT_PREFIX, _PACKED_USER_PROMPT_SUFFIX = _split_input_template(
+    language_translation_packed_user_prompt
+)
+
+
+def render_language_translation_user_prompt(input_text: str) -> str:
+    """
+    渲染翻译用户提示词（等价于 language_translation_user_prompt.format(input_text=...)）
+
+    Args:
+        input_text: 待翻译文本
+
+    Returns:
+        填充待翻译文本后的用户提示词
+    """
+    return _USER_PROMPT_PREFIX + input_text + _USER_PROMPT_SUFFIX
+
+
+def render_language_translation_packed_user_prompt(input_text: str) -> str:
+    """
+    渲染多段打包翻译的用户提示词（等价于 language_translation_packed_user_prompt.format(input_text=...)）
+
+    Args:
+        input_text: build_packed_translation_input 打包后的文本
+
+    Returns:
+        填充打包文本后的用户提示词
+    """
+    return _PACKED_USER_PROMPT_PREFIX + input_text + _PACKED_USER_PROMPT_SUFFIX
@@ -37,6 +37,12 @@ from src.retrieve.types.query import MetadataFilter
 # LLM₁ 路由规划 JSON 输出较长，需足够 completion 预算避免截断
 ROUTE_PLANNER_MAX_TOKENS: int = 8192
 
+# chunk_type → 中文标签（构建过滤条件描述时使用，模块级只构建一次）
+_CHUNK_TYPE_LABELS: Dict[str, str] = {
+    "text": "文本", "image": "图片",
+    "table": "表格", "code_block": "代码块",
+}
+
 
 class RoutePlanner:
     """LLM₁ 路由规划器
@@ -227,9 +233,6 @@ class RoutePlanner:
         if filters.source_type:
             parts.append(f"来源类型: {filters.source_type}")
         if filters.chunk_type:
-            type_label = {
-                "text": "文本", "image": "图片",
-                "table": "表格", "code_block": "代码块",
-            }.get(filters.chunk_type, filters.chunk_type)
+            type_label = _CHUNK_TYPE_LABELS.get(filters.chunk_type, filters.chunk_type)
             parts.append(f"chunk类型限定: {type_label}（只返回该类型的结果）")
         return ", ".join(parts) if parts else "无"
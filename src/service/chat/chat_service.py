@@ -59,6 +59,7 @@ import time
 from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
 
 from loguru import logger
+from pydantic import TypeAdapter
 
 from src.chat.stream_buffer import (
     StreamAccumulator,
@@ -1414,7 +1415,7 @@ class ChatService:
                         "finish_reason": resp.finish_reason,
                         "tool_calls_count": 0,
                         "citations_count": len(citations_for_display),
-                        "citations": [c.model_dump() for c in citations_for_display],
+                        "citations": _dump_citations(citations_for_display),
                         "has_thinking": bool(resp.thinking),
                         "usage": {
                             "prompt_tokens": resp.usage.prompt_tokens,
@@ -1554,7 +1555,7 @@ class ChatService:
                     "finish_reason": resp.finish_reason,
                     "tool_calls_count": len(resp.tool_calls),
                     "citations_count": len(citations_for_display),
-                    "citations": [c.model_dump() for c in citations_for_display],
+                    "citations": _dump_citations(citations_for_display),
                     "has_thinking": bool(resp.thinking),
                     "usage": {
                         "prompt_tokens": resp.usage.prompt_tokens,
@@ -2109,6 +2110,23 @@ class ChatService:
         return ""
 
 
+# ============================================================
+# 辅助：citations 序列化
+# ============================================================
+
+
+# 模块级构建一次，整列表走 pydantic-core 的序列化循环，省去逐个 model_dump 的 Python 调度
+_CITATION_LIST_ADAPTER: TypeAdapter[List[Citation]] = TypeAdapter(List[Citation])
+
+
+def _dump_citations(citations: List[Citation]) -> List[Dict[str, Any]]:
+    """把 citations 列表序列化为 MESSAGE_DONE 事件里的 dict 列表
+
+    输出与 ``[c.model_dump() for c in citations]`` 一致。
+    """
+    return _CITATION_LIST_ADAPTER.dump_python(citations)
+
+
 # ============================================================
 # 辅助：assistant message 序列化
 # ============================================================
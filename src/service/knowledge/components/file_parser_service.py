@@ -45,6 +45,44 @@ from src.index.common_file_extract.parser.file_parser import FileParser
 from src.types.models.parse_result import ParseResult, ParseStatus
 
 
+# ========== MongoDB content 构建（按元素类型分派）==========
+
+def _build_text_content(element: Dict) -> Dict[str, Any]:
+    return {"text": element.get("text", "")}
+
+
+def _build_image_content(element: Dict) -> Dict[str, Any]:
+    return {
+        "image_caption": element.get("image_caption", []),
+        "image_footnote": element.get("image_footnote", [])
+    }
+
+
+def _build_table_content(element: Dict) -> Dict[str, Any]:
+    return {
+        "table_caption": element.get("table_caption", []),
+        "table_footnote": element.get("table_footnote", []),
+        "table_body": element.get("table_body", "")
+    }
+
+
+def _build_equation_content(element: Dict) -> Dict[str, Any]:
+    return {
+        "text": element.get("text", ""),
+        "text_format": element.get("text_format", "")
+    }
+
+
+# element_type → content 构建函数；每个元素一次 dict 查找替代 if/elif 链
+_MONGO_CONTENT_BUILDERS = {
+    "text": _build_text_content,
+    "image": _build_image_content,
+    "table": _build_table_content,
+    "equation": _build_equation_content,
+    "discarded": _build_text_content,
+}
+
+
 class FileParserService:
     """
     文件解析服务（完整流程）
@@ -176,8 +214,12 @@ class FileParserService:
             logger.info("开始解析文件...")
             parse_result = await FileParser.parse(
                 file_path=temp_file_path,
-                file_name=filename
+                file_name=filename,
+                file_bytes=file_bytes
             )
+            # 原始文件字节只在解析阶段需要，提前释放引用，
+            # 避免大文件在后续图片上传、消息构建期间一直占用内存
+            del file_bytes
             logger.info("文件解析完成")
             
             # 4. 构建知识库信息
@@ -338,6 +380,17 @@ class FileParserService:
         mongodb_messages = []
         elements_payload: List[Dict[str, Any]] = []
         
+        # 知识库 / 审计字段对同一文档的所有元素都相同，只解析一次
+        common_fields = {
+            "knowledge_base_id": knowledge_base_info.get("knowledge_base_id"),
+            "knowledge_base_name": knowledge_base_info.get("knowledge_base_name"),
+            "parent_knowledge_base_id": knowledge_base_info.get("parent_knowledge_base_id"),
+            "parent_knowledge_base_name": knowledge_base_info.get("parent_knowledge_base_name"),
+            "knowledge_type": knowledge_base_info.get("knowledge_type"),
+            "creator": creator,
+            "updater": creator
+        }
+        
         # 遍历每一页
         for page_data in root_pages:
             page_idx = page_data.get("page_idx")
@@ -370,8 +423,7 @@ class FileParserService:
                     page_idx=page_idx,
                     bbox=bbox,
                     element=element,
-                    knowledge_base_info=knowledge_base_info,
-                    creator=creator,
+                    common_fields=common_fields,
                     bucket_name=bucket_name,
                     image_file_path=image_file_path,
                     document_id=document_id
@@ -463,7 +515,7 @@ class FileParserService:
             bucket_name = parts[0] if len(parts) > 1 else "knowledge-files"
             image_path = parts[1] if len(parts) > 1 else storage_path
             
-            logger.debug(f"图片上传成功: {storage_path}")
+            logger.debug("图片上传成功: {}", storage_path)
             return bucket_name, image_path
             
         except Exception as e:
@@ -478,17 +530,26 @@ class FileParserService:
         page_idx: int,
         bbox: list,
         element: Dict,
-        knowledge_base_info: Dict,
-        creator: str,
+        common_fields: Dict,
         bucket_name: Optional[str] = None,
         image_file_path: Optional[str] = None,
         document_id: str = ""
     ) -> Dict:
-        """构建 MySQL 插入消息"""
+        """
+        构建 MySQL 插入消息
+        
+        common_fields 为文档级公共字段（KnowledgeMixin + 审计字段），
+        由调用方每个文档只构建一次。
+        """
         # MinerU bbox 原样入库：[x0,y0,x1,y1]，0~1000 归一化，左上角原点
         page_position = None
         if bbox and len(bbox) == 4:
-            page_position = json.dumps(bbox)
+            x0, y0, x1, y1 = bbox
+            if type(x0) is int and type(y0) is int and type(x1) is int and type(y1) is int:
+                # 整数坐标（MinerU 常规输出）直接拼接，与 json.dumps 输出一致
+                page_position = f"[{x0}, {y0}, {x1}, {y1}]"
+            else:
+                page_position = json.dumps(bbox)
         
         # 提取 text_level（仅 text 类型）
         text_level = element.get("text_level") if element_type == "text" else None
@@ -522,15 +583,8 @@ class FileParserService:
             "image_file_type": image_file_type,
             "image_file_format": image_file_format,
             "image_file_suffix": image_file_suffix,
-            # KnowledgeMixin 字段
-            "knowledge_base_id": knowledge_base_info.get("knowledge_base_id"),
-            "knowledge_base_name": knowledge_base_info.get("knowledge_base_name"),
-            "parent_knowledge_base_id": knowledge_base_info.get("parent_knowledge_base_id"),
-            "parent_knowledge_base_name": knowledge_base_info.get("parent_knowledge_base_name"),
-            "knowledge_type": knowledge_base_info.get("knowledge_type"),
-            # BaseModel 字段
-            "creator": creator,
-            "updater": creator
+            # KnowledgeMixin 字段 + BaseModel 审计字段
+            **common_fields
         }
         
         return message
@@ -542,46 +596,14 @@ class FileParserService:
         element: Dict
     ) -> Dict:
         """构建 MongoDB 插入消息"""
-        # 根据类型提取内容
-        content = {}
-        
-        if element_type == "text":
-            content = {
-                "text": element.get("text", "")
-            }
-        elif element_type == "image":
-            content = {
-                "image_caption": element.get("image_caption", []),
-                "image_footnote": element.get("image_footnote", [])
-            }
-        elif element_type == "table":
-            content = {
-                "table_caption": element.get("table_caption", []),
-                "table_footnote": element.get("table_footnote", []),
-                "table_body": element.get("table_body", "")
-            }
-        elif element_type == "equation":
-            content = {
-                "text": element.get("text", ""),
-                "text_format": element.get("text_format", "")
-            }
-        elif element_type == "discarded":
-            content = {
-                "text": element.get("text", "")
-            }
-        else:
-            content = {
-                "text": element.get("text", "")
-            }
+        # 根据类型提取内容（未知类型按 text 处理）
+        build_content = _MONGO_CONTENT_BUILDERS.get(element_type, _build_text_content)
         
-        # 构建消息
-        message = {
+        return {
             "_id": element_id,
             "type": element_type,
-            "content": content
+            "content": build_content(element)
         }
-        
-        return message
     
     # ========== 私有方法: 数据转换 ==========
     
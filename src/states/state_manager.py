@@ -68,18 +68,21 @@ class FileProgressManager:
         Returns:
             初始化后的 FileIndexProgress
         """
-        progress = FileIndexProgress(
+        # 入参均为服务端可信值，使用 model_construct 跳过校验；
+        # 从 Redis 读回的数据仍走 from_redis_dict 的完整校验
+        progress = FileIndexProgress.model_construct(
             file_id=file_id,
             user_id=user_id,
             file_name=file_name,
             progress=stage_to_progress(IndexStage.INDEX_START),
             status=IndexStatus.PROCESSING,
-            stage=IndexStage.INDEX_START,
+            stage=IndexStage.INDEX_START.value,
             message="索引构建已提交",
         )
 
-        await self._ns.hset(file_id, mapping=progress.to_redis_dict())
-        await self._ns.expire(file_id, _PROGRESS_TTL)
+        await self._ns.hset_with_expire(
+            file_id, progress.to_redis_dict(), _PROGRESS_TTL
+        )
 
         logger.debug(f"初始化索引进度: file_id={file_id}, progress=0.10")
         return progress
@@ -95,6 +98,8 @@ class FileProgressManager:
         更新文件索引进度
 
         根据 stage 自动计算 progress 数值，写回 Redis Hash。
+        先 HGETALL 取出当前记录（同时充当存在性检查），写入后在本地合并
+        更新字段得到返回值，无需再回读 Redis。
 
         Args:
             file_id: 文件 ID
@@ -105,8 +110,8 @@ class FileProgressManager:
         Returns:
             更新后的 FileIndexProgress，若 key 不存在返回 None
         """
-        exists = await self._ns.exists(file_id)
-        if not exists:
+        current: Dict[str, str] = await self._ns.hgetall(file_id)
+        if not current:
             logger.warning(f"更新进度失败，key 不存在: file_id={file_id}")
             return None
 
@@ -122,15 +127,15 @@ class FileProgressManager:
         if message is not None:
             update_fields["message"] = message
 
-        await self._ns.hset(file_id, mapping=update_fields)
-        await self._ns.expire(file_id, _PROGRESS_TTL)
+        await self._ns.hset_with_expire(file_id, update_fields, _PROGRESS_TTL)
 
         logger.debug(
             f"更新索引进度: file_id={file_id}, stage={stage}, "
             f"progress={computed_progress}, status={status.value}"
         )
 
-        return await self.get_progress(file_id)
+        current.update(update_fields)
+        return self._parse_progress(file_id, current)
 
     async def get_progress(self, file_id: str) -> Optional[FileIndexProgress]:
         """
@@ -143,14 +148,7 @@ class FileProgressManager:
             FileIndexProgress，Redis 中无数据返回 None
         """
         data: Dict[str, str] = await self._ns.hgetall(file_id)
-        if not data:
-            return None
-
-        try:
-            return FileIndexProgress.from_redis_dict(data)
-        except Exception as e:
-            logger.error(f"反序列化进度数据失败: file_id={file_id}, error={e}")
-            return None
+        return self._parse_progress(file_id, data)
 
     async def get_batch_progress(
         self, file_ids: List[str]
@@ -158,7 +156,7 @@ class FileProgressManager:
         """
         批量查询文件索引进度
 
-        对每个 file_id 执行 HGETALL，返回与 file_ids 等长的列表。
+        所有 file_id 的 HGETALL 通过 pipeline 一次往返完成，返回与 file_ids 等长的列表。
 
         Args:
             file_ids: 文件 ID 列表
@@ -166,10 +164,34 @@ class FileProgressManager:
         Returns:
             与 file_ids 同序的进度列表，无数据的位置为 None
         """
-        results: List[Optional[FileIndexProgress]] = []
-        for fid in file_ids:
-            results.append(await self.get_progress(fid))
-        return results
+        batch_data = await self._ns.hgetall_many(file_ids)
+        return [
+            self._parse_progress(fid, data)
+            for fid, data in zip(file_ids, batch_data)
+        ]
+
+    @staticmethod
+    def _parse_progress(
+        file_id: str, data: Dict[str, str]
+    ) -> Optional[FileIndexProgress]:
+        """
+        将 Redis Hash 数据反序列化为 FileIndexProgress
+
+        Args:
+            file_id: 文件 ID（用于日志）
+            data: HGETALL 结果
+
+        Returns:
+            FileIndexProgress，无数据或反序列化失败返回 None
+        """
+        if not data:
+            return None
+
+        try:
+            return FileIndexProgress.from_redis_dict(data)
+        except Exception as e:
+            logger.error(f"反序列化进度数据失败: file_id={file_id}, error={e}")
+            return None
 
     async def delete_progress(self, file_id: str) -> bool:
         """
@@ -12,15 +12,60 @@
 @Copyright：Copyright(c) 2024-2026. All Rights Reserved
 =================================================="""
 
-import toml
+import threading
+import tomllib
 from pathlib import Path
-from typing import Any, Dict, Optional, List
-from copy import deepcopy
+from typing import Any, Dict, Optional, List, Tuple
 from loguru import logger
 
 from src.utils.env_manager import EnvManager
 
 
+# 点号路径解析结果中「路径不存在」的哨兵值
+_MISSING = object()
+
+
+# 必需的配置节和字段（validate 使用）
+_REQUIRED_CONFIG_FIELDS: Dict[str, frozenset] = {
+    "milvus": frozenset({"host", "port", "vector_dim"}),
+    "mongodb": frozenset({"host", "port", "database"}),
+    "mysql": frozenset({"host", "port", "database"}),
+    "neo4j": frozenset({"uri", "database"}),
+    "redis": frozenset({"host", "port"}),
+    "storage": frozenset({"type"}),
+    "minio": frozenset({"endpoint", "default_bucket"}),
+    "kafka": frozenset({"bootstrap_servers"}),
+    "proxy": frozenset({"default_timeout"}),
+    "llm": frozenset({"presets"}),
+    "embedding": frozenset({"default_preset", "dimension", "presets"}),
+    "sparse_embedding": frozenset({"api_base", "model_name"}),
+    "reranker": frozenset({"default_preset", "presets"}),
+    "mineru": frozenset({"api_url"}),
+    "logging": frozenset({"level", "log_dir", "log_file"}),
+    "file_upload": frozenset({"supported_formats", "max_file_size", "temp_dir"}),
+}
+
+
+def _copy_tree(value: Any) -> Any:
+    """
+    复制 TOML 配置树（只复制 dict / list 容器）
+    
+    TOML 的叶子值（str / int / float / bool / 日期时间）均为不可变对象，可以直接共享；
+    相比 deepcopy 省去了 memo 表与逐对象类型分派，返回值仍与内部配置完全独立。
+    
+    Args:
+        value: 配置值
+        
+    Returns:
+        复制后的配置值
+    """
+    if isinstance(value, dict):
+        return {k: _copy_tree(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_tree(v) for v in value]
+    return value
+
+
 class ConfigManager:
     """配置文件管理器"""
     
@@ -36,6 +81,10 @@ class ConfigManager:
         """
         self._config_file = config_file
         self._config: Dict[str, Any] = {}
+        # 点号路径 → 解析结果缓存（配置加载后不变，reload 时清空）
+        self._path_cache: Dict[str, Any] = {}
+        # 已加载文件的 (mtime_ns, size)，reload 时文件未变化则跳过重新解析
+        self._loaded_stamp: Optional[Tuple[int, int]] = None
         self._load_config()
     
     def _load_config(self) -> None:
@@ -50,9 +99,19 @@ class ConfigManager:
         if not config_path.exists():
             raise FileNotFoundError(f"配置文件不存在: {config_path}")
         
+        # 文件未变化（修改时间与大小均一致）时复用已解析的配置
+        stat = config_path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp == self._loaded_stamp:
+            logger.debug(f"配置文件未变化，跳过重新解析: {config_path}")
+            return
+        
         # 加载TOML配置
         try:
-            self._config = toml.load(config_path)
+            with open(config_path, "rb") as f:
+                self._config = tomllib.load(f)
+            self._path_cache.clear()
+            self._loaded_stamp = stamp
             logger.info(f"已加载配置文件: {config_path}")
         except Exception as e:
             raise ValueError(f"配置文件加载失败: {e}")
@@ -79,16 +138,8 @@ class ConfigManager:
             >>> config.get("milvus.port")
             19530
         """
-        keys = path.split(".")
-        value = self._config
-        
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
-                return default
-        
-        return value
+        value = self._resolve(path)
+        return default if value is _MISSING else value
     
     def get_section(self, section: str) -> Dict[str, Any]:
         """
@@ -100,7 +151,7 @@ class ConfigManager:
         Returns:
             配置节字典的深拷贝
         """
-        return deepcopy(self._config.get(section, {}))
+        return _copy_tree(self._config.get(section, {}))
     
     def has(self, path: str) -> bool:
         """
@@ -112,16 +163,33 @@ class ConfigManager:
         Returns:
             是否存在
         """
-        keys = path.split(".")
-        value = self._config
+        return self._resolve(path) is not _MISSING
+    
+    def _resolve(self, path: str) -> Any:
+        """
+        解析点号路径（结果按路径缓存）
+        
+        Args:
+            path: 配置路径，如 "milvus.host"
+            
+        Returns:
+            配置值；路径不存在时返回 _MISSING
+        """
+        try:
+            return self._path_cache[path]
+        except KeyError:
+            pass
         
-        for key in keys:
+        value = self._config
+        for key in path.split("."):
             if isinstance(value, dict) and key in value:
                 value = value[key]
             else:
-                return False
+                value = _MISSING
+                break
         
-        return True
+        self._path_cache[path] = value
+        return value
     
     def get_all(self) -> Dict[str, Any]:
         """
@@ -130,7 +198,7 @@ class ConfigManager:
         Returns:
             配置字典的深拷贝
         """
-        return deepcopy(self._config)
+        return _copy_tree(self._config)
     
     # ==================== 数据库配置获取 ====================
     
@@ -208,7 +276,7 @@ class ConfigManager:
 
     def get_llm_presets(self) -> Dict[str, Dict[str, Any]]:
         """获取所有 LLM 预设（[llm.presets]）"""
-        return deepcopy(self._config.get("llm", {}).get("presets", {}) or {})
+        return _copy_tree(self._config.get("llm", {}).get("presets", {}) or {})
 
     def get_llm_preset(self, name: str) -> Optional[Dict[str, Any]]:
         """
@@ -222,7 +290,7 @@ class ConfigManager:
         """
         presets = self._config.get("llm", {}).get("presets", {}) or {}
         preset = presets.get(name)
-        return deepcopy(preset) if preset else None
+        return _copy_tree(preset) if preset else None
 
     # ==================== Embedding / Reranker presets ====================
 
@@ -232,13 +300,13 @@ class ConfigManager:
 
     def get_embedding_presets(self) -> Dict[str, Dict[str, Any]]:
         """获取所有 Embedding 预设（[embedding.presets]）"""
-        return deepcopy(self._config.get("embedding", {}).get("presets", {}) or {})
+        return _copy_tree(self._config.get("embedding", {}).get("presets", {}) or {})
 
     def get_embedding_preset(self, name: str) -> Optional[Dict[str, Any]]:
         """获取单个 Embedding preset"""
         presets = self._config.get("embedding", {}).get("presets", {}) or {}
         preset = presets.get(name)
-        return deepcopy(preset) if preset else None
+        return _copy_tree(preset) if preset else None
 
     def get_sparse_embedding_config(self) -> Dict[str, Any]:
         """获取稀疏向量 Embedding 配置（BGE-M3，独立实现）"""
@@ -250,13 +318,13 @@ class ConfigManager:
 
     def get_reranker_presets(self) -> Dict[str, Dict[str, Any]]:
         """获取所有 Reranker 预设（[reranker.presets]）"""
-        return deepcopy(self._config.get("reranker", {}).get("presets", {}) or {})
+        return _copy_tree(self._config.get("reranker", {}).get("presets", {}) or {})
 
     def get_reranker_preset(self, name: str) -> Optional[Dict[str, Any]]:
         """获取单个 Reranker preset"""
         presets = self._config.get("reranker", {}).get("presets", {}) or {}
         preset = presets.get(name)
-        return deepcopy(preset) if preset else None
+        return _copy_tree(preset) if preset else None
     
     # ==================== 第三方服务配置获取 ====================
     
@@ -285,36 +353,15 @@ class ConfigManager:
         """
         validation_results = {}
         
-        # 定义必需的配置节和字段
-        required_configs = {
-            "milvus": ["host", "port", "vector_dim"],
-            "mongodb": ["host", "port", "database"],
-            "mysql": ["host", "port", "database"],
-            "neo4j": ["uri", "database"],
-            "redis": ["host", "port"],
-            "storage": ["type"],
-            "minio": ["endpoint", "default_bucket"],
-            "kafka": ["bootstrap_servers"],
-            "proxy": ["default_timeout"],
-            "llm": ["presets"],
-            "embedding": ["default_preset", "dimension", "presets"],
-            "sparse_embedding": ["api_base", "model_name"],
-            "reranker": ["default_preset", "presets"],
-            "mineru": ["api_url"],
-            "logging": ["level", "log_dir", "log_file"],
-            "file_upload": ["supported_formats", "max_file_size", "temp_dir"],
-        }
-        
-        for section, required_fields in required_configs.items():
-            missing_fields = []
-            section_config = self.get_section(section)
-            
-            for field in required_fields:
-                if field not in section_config:
-                    missing_fields.append(field)
+        # 每节一次集合差运算，直接读取内部配置，避免 get_section 的整节复制
+        for section, required_fields in _REQUIRED_CONFIG_FIELDS.items():
+            section_config = self._config.get(section)
+            if not isinstance(section_config, dict):
+                section_config = {}
             
+            missing_fields = required_fields - section_config.keys()
             if missing_fields:
-                validation_results[section] = missing_fields
+                validation_results[section] = sorted(missing_fields)
         
         return validation_results
     
@@ -553,6 +600,7 @@ class ConfigManager:
 
 # 创建全局单例
 _config_manager_instance: Optional[ConfigManager] = None
+_config_manager_lock = threading.Lock()
 
 
 def get_config_manager(config_file: Optional[str] = None) -> ConfigManager:
@@ -567,8 +615,11 @@ def get_config_manager(config_file: Optional[str] = None) -> ConfigManager:
     """
     global _config_manager_instance
     
+    # 双重检查锁：初始化后无锁读取；多线程并发首次调用时只构造一次
     if _config_manager_instance is None:
-        _config_manager_instance = ConfigManager(config_file)
+        with _config_manager_lock:
+            if _config_manager_instance is None:
+                _config_manager_instance = ConfigManager(config_file)
     
     return _config_manager_instance
 
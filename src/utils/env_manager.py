@@ -13,12 +13,73 @@
 =================================================="""
 
 import os
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any, List
-from dotenv import load_dotenv
+from typing import Optional, Dict, Any, List, Tuple
+from dotenv import dotenv_values
 from loguru import logger
 
 
+# 布尔值的多种字符串表示 → 布尔值（比较前统一 lower().strip()）
+_BOOL_MAP: Dict[str, bool] = {
+    "true": True, "1": True, "yes": True, "on": True, "t": True, "y": True,
+    "false": False, "0": False, "no": False, "off": False, "f": False, "n": False,
+}
+
+
+# 环境变量值在进程内基本不变，类型解析结果按原始字符串缓存，重复读取时不再重复解析
+
+@lru_cache(maxsize=256)
+def _parse_int(value: str) -> Optional[int]:
+    """字符串 → 整数，无法转换时返回 None"""
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=256)
+def _parse_bool(value: str) -> Optional[bool]:
+    """字符串 → 布尔值，无法识别时返回 None"""
+    return _BOOL_MAP.get(value.lower().strip())
+
+
+@lru_cache(maxsize=256)
+def _parse_list(value: str, separator: str) -> Tuple[str, ...]:
+    """字符串 → 去空白、去空项后的元组（元组不可变，可安全缓存）"""
+    # 每项只 strip 一次，空项由 filter 丢弃
+    return tuple(filter(None, map(str.strip, value.split(separator))))
+
+
+# .env 解析结果缓存：绝对路径 → ((mtime_ns, size), 解析结果)，文件未变化时重复创建 EnvManager 不再重新解析
+_DOTENV_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, str]]] = {}
+
+
+def _read_dotenv(env_path: Path) -> Dict[str, str]:
+    """
+    读取并解析 .env 文件（按文件 mtime / size 缓存）
+    
+    Args:
+        env_path: .env 文件路径
+        
+    Returns:
+        变量名 → 值（无值的声明行，如单独一行 FOO，解析为 None，与 load_dotenv 一致地跳过）
+    """
+    stat = env_path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cache_key = str(env_path.resolve())
+    
+    cached = _DOTENV_CACHE.get(cache_key)
+    if cached is None or cached[0] != stamp:
+        values = {k: v for k, v in dotenv_values(env_path).items() if v is not None}
+        cached = (stamp, values)
+        _DOTENV_CACHE[cache_key] = cached
+    
+    # 返回副本，调用方修改不影响缓存
+    return dict(cached[1])
+
+
 class EnvManager:
     """环境变量管理器"""
     
@@ -39,7 +100,6 @@ class EnvManager:
             env_file: .env 文件路径，如果为None则使用默认路径
         """
         self._env_file = env_file
-        self._env_vars: Dict[str, str] = {}
         self._load_env()
     
     def _load_env(self) -> None:
@@ -50,21 +110,21 @@ class EnvManager:
         else:
             env_path = self.DEFAULT_ENV_PATH
         
-        # 检查文件是否存在
-        if not env_path.exists():
+        # 检查文件是否存在，存在则加载.env文件
+        if env_path.exists():
+            # 等价于 load_dotenv(override=True)：同步写入 os.environ，
+            # get 与直接 os.getenv 的代码、第三方库读到的是同一份值
+            os.environ.update(_read_dotenv(env_path))
+            logger.info(f"已加载环境变量文件: {env_path}")
+        else:
             logger.warning(f"环境变量文件不存在: {env_path}，将仅使用系统环境变量")
-            return
-        
-        # 加载.env文件
-        load_dotenv(env_path, override=True)
-        logger.info(f"已加载环境变量文件: {env_path}")
-        
-        # 缓存环境变量
-        self._cache_env_vars()
     
-    def _cache_env_vars(self) -> None:
-        """缓存环境变量到内存"""
-        self._env_vars = dict(os.environ)
+    @staticmethod
+    def clear_cache() -> None:
+        """清空类型解析缓存（get_int / get_bool / get_list）"""
+        _parse_int.cache_clear()
+        _parse_bool.cache_clear()
+        _parse_list.cache_clear()
     
     def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
         """
@@ -77,7 +137,8 @@ class EnvManager:
         Returns:
             环境变量值
         """
-        return os.getenv(key, default)
+        # .env 已在加载时写入 os.environ，直接实时读取，进程内后续修改立即可见
+        return os.environ.get(key, default)
     
     def get_required(self, key: str) -> str:
         """
@@ -111,11 +172,12 @@ class EnvManager:
         value = self.get(key)
         if value is None:
             return default
-        try:
-            return int(value)
-        except ValueError:
+        
+        parsed = _parse_int(value)
+        if parsed is None:
             logger.warning(f"环境变量 {key} 无法转换为整数: {value}，使用默认值 {default}")
             return default
+        return parsed
     
     def get_bool(self, key: str, default: bool = False) -> bool:
         """
@@ -132,18 +194,12 @@ class EnvManager:
         if value is None:
             return default
         
-        # 支持多种布尔值表示
-        true_values = {"true", "1", "yes", "on", "t", "y"}
-        false_values = {"false", "0", "no", "off", "f", "n"}
-        
-        value_lower = value.lower().strip()
-        if value_lower in true_values:
-            return True
-        elif value_lower in false_values:
-            return False
-        else:
+        # 支持多种布尔值表示（见 _BOOL_MAP）
+        parsed = _parse_bool(value)
+        if parsed is None:
             logger.warning(f"环境变量 {key} 的值 '{value}' 无法识别为布尔值，使用默认值 {default}")
             return default
+        return parsed
     
     def get_list(self, key: str, separator: str = ",", default: Optional[List[str]] = None) -> List[str]:
         """
@@ -161,7 +217,8 @@ class EnvManager:
         if value is None:
             return default or []
         
-        return [item.strip() for item in value.split(separator) if item.strip()]
+        # 缓存的是元组，每次返回新列表，调用方修改不会污染缓存
+        return list(_parse_list(value, separator))
     
     def validate_required_vars(self, required_vars: Optional[List[str]] = None) -> Dict[str, bool]:
         """
@@ -176,11 +233,9 @@ class EnvManager:
         if required_vars is None:
             required_vars = list(self._critical_vars)
         
-        results = {}
-        for var in required_vars:
-            results[var] = self.get(var) is not None
-        
-        return results
+        # 一次集合差运算找出缺失变量，不再逐个调用 get
+        missing_vars = set(required_vars) - os.environ.keys()
+        return {var: var not in missing_vars for var in required_vars}
     
     def check_health(self) -> bool:
         """
@@ -189,11 +244,10 @@ class EnvManager:
         Returns:
             是否健康
         """
-        validation_results = self.validate_required_vars()
-        missing_vars = [var for var, exists in validation_results.items() if not exists]
+        missing_vars = self._critical_vars - os.environ.keys()
         
         if missing_vars:
-            logger.error(f"缺少必需的环境变量: {', '.join(missing_vars)}")
+            logger.error(f"缺少必需的环境变量: {', '.join(sorted(missing_vars))}")
             return False
         
         logger.info("环境变量健康检查通过")
@@ -321,6 +375,7 @@ class EnvManager:
 
 # 创建全局单例
 _env_manager_instance: Optional[EnvManager] = None
+_env_manager_lock = threading.Lock()
 
 
 def get_env_manager(env_file: Optional[str] = None) -> EnvManager:
@@ -335,18 +390,23 @@ def get_env_manager(env_file: Optional[str] = None) -> EnvManager:
     """
     global _env_manager_instance
     
+    # 双重检查锁：初始化后无锁读取；多线程并发首次调用时只构造一次（只加载一次 .env）
     if _env_manager_instance is None:
-        _env_manager_instance = EnvManager(env_file)
+        with _env_manager_lock:
+            if _env_manager_instance is None:
+                _env_manager_instance = EnvManager(env_file)
     
     return _env_manager_instance
 
 
-# 便捷函数
+# 便捷函数（单例已创建时直接使用，省去一次 get_env_manager 调用）
 def get_env(key: str, default: Optional[str] = None) -> Optional[str]:
     """获取环境变量的便捷函数"""
-    return get_env_manager().get(key, default)
+    manager = _env_manager_instance or get_env_manager()
+    return manager.get(key, default)
 
 
 def get_required_env(key: str) -> str:
     """获取必需环境变量的便捷函数"""
-    return get_env_manager().get_required(key)
+    manager = _env_manager_instance or get_env_manager()
+    return manager.get_required(key)
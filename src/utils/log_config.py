@@ -13,9 +13,23 @@
 =================================================="""
 import sys
 import logging
+import threading
 from pathlib import Path
 from loguru import logger
-from typing import Optional
+from typing import Dict, Literal, Optional, Set, Tuple, Union
+
+
+# 默认日志目录：项目根目录下的 logs 文件夹（导入时计算一次）
+_DEFAULT_LOG_DIR = Path(__file__).parent.parent.parent / "logs"
+
+# 本进程内已确认存在的日志目录，重复调用 setup_logging 时跳过 mkdir
+_CREATED_LOG_DIRS: Set[Path] = set()
+
+# 标准 logging 级别名 → loguru 级别名（loguru 未注册的级别不缓存，每次回退为 levelno）
+_LEVEL_NAME_CACHE: Dict[str, str] = {}
+
+# 调用点 (pathname, lineno) → loguru opt 的栈深度；同一调用点只在首次记录时回溯栈帧
+_CALLER_DEPTH_CACHE: Dict[Tuple[str, int], int] = {}
 
 
 class InterceptHandler(logging.Handler):
@@ -24,16 +38,24 @@ class InterceptHandler(logging.Handler):
     """
     def emit(self, record: logging.LogRecord) -> None:
         # 获取对应的 loguru level
-        try:
-            level = logger.level(record.levelname).name
-        except ValueError:
-            level = record.levelno
+        level = _LEVEL_NAME_CACHE.get(record.levelname)
+        if level is None:
+            try:
+                level = logger.level(record.levelname).name
+                _LEVEL_NAME_CACHE[record.levelname] = level
+            except ValueError:
+                level = record.levelno
 
-        # 找到调用者的栈帧
-        frame, depth = logging.currentframe(), 2
-        while frame and frame.f_code.co_filename == logging.__file__:
-            frame = frame.f_back
-            depth += 1
+        # 找到调用者的栈帧（按调用点缓存深度，高频日志的库不再逐条回溯）
+        call_site = (record.pathname, record.lineno)
+        depth = _CALLER_DEPTH_CACHE.get(call_site)
+        if depth is None:
+            # 从 emit 自身的栈帧出发，跳过 logging 模块内部的帧
+            frame, depth = sys._getframe(), 0
+            while frame and (depth == 0 or frame.f_code.co_filename == logging.__file__):
+                frame = frame.f_back
+                depth += 1
+            _CALLER_DEPTH_CACHE[call_site] = depth
 
         logger.opt(depth=depth, exception=record.exc_info).log(
             level, record.getMessage()
@@ -51,7 +73,7 @@ def setup_logging(
     enable_file: bool = True,
     diagnose: bool = False,
     backtrace: bool = True,
-    enqueue: bool = True
+    enqueue: Union[bool, Literal["auto"]] = False
 ) -> None:
     """
     配置全局日志系统，将标准 logging 拦截到 loguru
@@ -68,9 +90,15 @@ def setup_logging(
     :param enable_file: 是否启用文件输出，默认 True
     :param diagnose: 是否启用诊断模式（显示变量值），调试时可开启，默认 False
     :param backtrace: 是否显示完整的异常堆栈，默认 True
-    :param enqueue: 是否使用队列异步写入（线程安全），默认 True
+    :param enqueue: 是否使用队列异步写入，默认 False（直接写入）
+                    loguru 的 sink 本身线程安全；enqueue=True 时每条日志需序列化后经队列
+                    交给后台线程写入，适合多线程 / 多进程写同一文件的服务进程；
+                    "auto" 表示启用文件输出或当前已有多个线程时开启
     """
     
+    if enqueue == "auto":
+        enqueue = enable_file or threading.active_count() > 1
+    
     # 移除 loguru 的默认 handler
     logger.remove()
     
@@ -99,13 +127,14 @@ def setup_logging(
         # 确定日志目录
         if log_dir is None:
             # 默认使用项目根目录下的 logs 文件夹
-            project_root = Path(__file__).parent.parent.parent
-            log_dir = project_root / "logs"
+            log_dir = _DEFAULT_LOG_DIR
         else:
             log_dir = Path(log_dir)
         
         # 创建日志目录
-        log_dir.mkdir(parents=True, exist_ok=True)
+        if log_dir not in _CREATED_LOG_DIRS:
+            log_dir.mkdir(parents=True, exist_ok=True)
+            _CREATED_LOG_DIRS.add(log_dir)
         
         # 日志文件路径
         log_path = log_dir / log_file
@@ -130,9 +159,11 @@ def setup_logging(
     logging.basicConfig(handlers=[InterceptHandler()], level=0, force=True)
     
     # 拦截所有使用标准 logging 的第三方库
-    for logger_name in logging.root.manager.loggerDict.keys():
-        logging.getLogger(logger_name).handlers = []
-        logging.getLogger(logger_name).propagate = True
+    # 直接遍历已创建的 Logger 对象：省去按名 getLogger 的查找，也不会把 PlaceHolder 占位节点实例化成 Logger
+    for std_logger in list(logging.root.manager.loggerDict.values()):
+        if isinstance(std_logger, logging.Logger):
+            std_logger.handlers.clear()
+            std_logger.propagate = True
     
     # 配置 root logger
     logging.getLogger().handlers = [InterceptHandler()]
@@ -186,7 +217,8 @@ def setup_dev_logging():
         enable_file=True,
         log_file="dev.log",
         diagnose=True,
-        backtrace=True
+        backtrace=True,
+        enqueue=False
     )
 
 
@@ -200,7 +232,8 @@ def setup_prod_logging():
         rotation="1 day",  # 每天轮转
         retention="30 days",  # 保留30天
         diagnose=False,
-        backtrace=False
+        backtrace=False,
+        enqueue=True
     )
 
 
@@ -210,7 +243,8 @@ def setup_test_logging():
         log_level="DEBUG",
         enable_console=True,
         enable_file=False,
-        diagnose=True
+        diagnose=True,
+        enqueue=False
     )
 
 
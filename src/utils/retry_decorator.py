@@ -22,11 +22,24 @@ from typing import (
 import asyncio
 import logging
 import functools
+import os
 from enum import Enum
 import time
 import concurrent.futures
 
 
+# 超时异常类型（Python 3.11+ 中 asyncio.TimeoutError 即内置 TimeoutError，此处统一处理）
+_TIMEOUT_ERRORS = (asyncio.TimeoutError, TimeoutError)
+
+# retry_sync 带超时调用共用的线程池（线程按需创建、复用，避免每次调用都新建线程）
+# 注意：超时后函数仍会占用线程直到执行完毕；大量调用持续超时时，池满后新调用需排队，
+# 排队时间同样计入 timeout。
+_SYNC_TIMEOUT_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) * 4),
+    thread_name_prefix="retry-sync"
+)
+
+
 class RetryStrategy(Enum):
     """重试策略枚举"""
     FIXED = "fixed"
@@ -63,72 +76,73 @@ def retry_async(
     """
 
     def decorator(func: Callable) -> Callable:
+        # 函数名、logger、重试策略与延迟序列在装饰时确定，不随每次调用重复计算
+        # （logging.getLogger 对同名返回同一实例，闭包只读引用，无并发问题）
+        func_name = func.__name__
+        _logger = logger if logger is not None else logging.getLogger(func_name)
+        strategy = _resolve_strategy(retry_strategy, _logger)
+        delays = tuple(
+            _calculate_delay(retry_delay, attempt, strategy, max_delay)
+            for attempt in range(max_retries - 1)
+        )
+
+        # 根据是否设置timeout在装饰时确定调用方式，wrapper 内不再逐次判断
+        if timeout is not None:
+            mode = f"with timeout {timeout}s"
+
+            def call(*args, **kwargs):
+                return asyncio.wait_for(func(*args, **kwargs), timeout=timeout)
+        else:
+            mode = "without timeout"
+            call = func
+
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
-            # 在wrapper内部初始化logger，避免nonlocal的并发安全问题
-            _logger = logger if logger is not None else logging.getLogger(func.__name__)
-
-            # 转换重试策略为枚举类型
-            strategy = retry_strategy
-            if isinstance(retry_strategy, str):
-                try:
-                    strategy = RetryStrategy(retry_strategy.lower())
-                except ValueError:
-                    _logger.error(f"Invalid retry strategy: {retry_strategy}")
-                    raise ValueError(f"Invalid retry strategy: {retry_strategy}")
-
             last_exception = None
 
             for attempt in range(max_retries):
                 try:
-                    # 根据是否设置timeout来决定调用方式
-                    if timeout is not None:
-                        _logger.debug(f"{func.__name__} attempt {attempt + 1}/{max_retries} with timeout {timeout}s")
-                        result = await asyncio.wait_for(func(*args, **kwargs), timeout=timeout)
-                    else:
-                        _logger.debug(f"{func.__name__} attempt {attempt + 1}/{max_retries} without timeout")
-                        result = await func(*args, **kwargs)
+                    _logger.debug("%s attempt %d/%d %s", func_name, attempt + 1, max_retries, mode)
+                    result = await call(*args, **kwargs)
 
                     if attempt > 0:
-                        _logger.info(f"{func.__name__} succeeded on attempt {attempt + 1}")
+                        _logger.info("%s succeeded on attempt %d", func_name, attempt + 1)
                     return result
 
-                except (asyncio.TimeoutError, TimeoutError) as e:
-                    # 统一处理超时异常（兼容Python 3.11+）
-                    last_exception = e
-                    _logger.log(
-                        log_level,
-                        f"{func.__name__} attempt {attempt + 1}/{max_retries} timeout after {timeout}s"
-                    )
-
-                    # 如果不是最后一次尝试，则等待后重试
-                    if attempt < max_retries - 1:
-                        delay = _calculate_delay(retry_delay, attempt, strategy, max_delay)
-                        _logger.debug(f"Retrying in {delay} seconds...")
-                        await asyncio.sleep(delay)
+                except BaseException as e:
+                    # 单一异常处理入口，按类型分流：超时 / 可重试异常 / 不可重试异常
+                    if isinstance(e, _TIMEOUT_ERRORS):
+                        _logger.log(
+                            log_level,
+                            "%s attempt %d/%d timeout after %ss", func_name, attempt + 1, max_retries, timeout
+                        )
+                    elif isinstance(e, exceptions):
+                        _logger.log(
+                            log_level,
+                            "%s attempt %d/%d failed: %s: %s",
+                            func_name, attempt + 1, max_retries, type(e).__name__, e
+                        )
+                    elif isinstance(e, Exception):
+                        # 对于不在重试范围内的异常，直接抛出
+                        # 注意：如果exceptions=Exception（默认值），这个分支永远不会执行
+                        _logger.error(
+                            "%s failed with non-retryable exception: %s: %s", func_name, type(e).__name__, e
+                        )
+                        raise
+                    else:
+                        # 任务取消、KeyboardInterrupt 等不重试也不记录，原样抛出
+                        raise
 
-                except exceptions as e:
-                    # 只有当exceptions不是Exception基类时，这个分支才有意义
                     last_exception = e
-                    _logger.log(
-                        log_level,
-                        f"{func.__name__} attempt {attempt + 1}/{max_retries} failed: {type(e).__name__}: {str(e)}"
-                    )
 
                     # 如果不是最后一次尝试，则等待后重试
                     if attempt < max_retries - 1:
-                        delay = _calculate_delay(retry_delay, attempt, strategy, max_delay)
-                        _logger.debug(f"Retrying in {delay} seconds...")
+                        delay = delays[attempt]
+                        _logger.debug("Retrying in %s seconds...", delay)
                         await asyncio.sleep(delay)
 
-                except Exception as e:
-                    # 对于不在重试范围内的异常，直接抛出
-                    # 注意：如果exceptions=Exception（默认值），这个分支永远不会执行
-                    _logger.error(f"{func.__name__} failed with non-retryable exception: {type(e).__name__}: {str(e)}")
-                    raise
-
             # 所有重试都失败
-            error_msg = f"{func.__name__} failed after {max_retries} attempts"
+            error_msg = f"{func_name} failed after {max_retries} attempts"
             _logger.error(error_msg)
 
             if raise_on_failure:
@@ -137,7 +151,7 @@ def retry_async(
                 else:
                     raise RuntimeError(error_msg)
             else:
-                _logger.warning(f"Returning default value: {default_return_value}")
+                _logger.warning("Returning default value: %s", default_return_value)
                 return default_return_value
 
         return wrapper
@@ -178,86 +192,87 @@ def retry_sync(
     """
 
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            # 在wrapper内部初始化logger，避免nonlocal的并发安全问题
-            _logger = logger if logger is not None else logging.getLogger(func.__name__)
-
-            # 转换重试策略为枚举类型
-            strategy = retry_strategy
-            if isinstance(retry_strategy, str):
+        # 函数名、logger、重试策略与延迟序列在装饰时确定，不随每次调用重复计算
+        # （logging.getLogger 对同名返回同一实例，闭包只读引用，无并发问题）
+        func_name = func.__name__
+        _logger = logger if logger is not None else logging.getLogger(func_name)
+        strategy = _resolve_strategy(retry_strategy, _logger)
+        delays = tuple(
+            _calculate_delay(retry_delay, attempt, strategy, max_delay)
+            for attempt in range(max_retries - 1)
+        )
+
+        # 根据是否设置timeout在装饰时确定调用方式，wrapper 内不再逐次判断
+        if timeout is not None:
+            mode = f"with timeout {timeout}s"
+
+            def call(*args, **kwargs):
+                # 使用共享线程池实现超时
+                # 注意：这里无法真正取消正在执行的函数
+                future = _SYNC_TIMEOUT_EXECUTOR.submit(func, *args, **kwargs)
                 try:
-                    strategy = RetryStrategy(retry_strategy.lower())
-                except ValueError:
-                    _logger.error(f"Invalid retry strategy: {retry_strategy}")
-                    raise ValueError(f"Invalid retry strategy: {retry_strategy}")
+                    return future.result(timeout=timeout)
+                except concurrent.futures.TimeoutError:
+                    # 警告：函数仍在后台运行，执行完毕后线程归还线程池
+                    _logger.warning(
+                        "%s timed out after %ss, "
+                        "but the function may still be running in background thread",
+                        func_name, timeout
+                    )
+                    # 尝试取消（仅对尚在排队、未开始执行的任务有效）
+                    future.cancel()
+                    raise TimeoutError(f"Function call timed out after {timeout} seconds")
+        else:
+            mode = "without timeout"
+            call = func
 
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
             last_exception = None
 
             for attempt in range(max_retries):
                 try:
-                    # 根据是否设置timeout来决定调用方式
-                    if timeout is not None:
-                        _logger.debug(f"{func.__name__} attempt {attempt + 1}/{max_retries} with timeout {timeout}s")
-                        
-                        # 使用ThreadPoolExecutor实现超时
-                        # 注意：这里无法真正取消正在执行的函数
-                        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                            future = executor.submit(func, *args, **kwargs)
-                            try:
-                                result = future.result(timeout=timeout)
-                            except concurrent.futures.TimeoutError:
-                                # 警告：函数仍在后台运行
-                                _logger.warning(
-                                    f"{func.__name__} timed out after {timeout}s, "
-                                    f"but the function may still be running in background thread"
-                                )
-                                # 尝试取消（但对于已经在执行的任务无效）
-                                future.cancel()
-                                raise TimeoutError(f"Function call timed out after {timeout} seconds")
-                    else:
-                        _logger.debug(f"{func.__name__} attempt {attempt + 1}/{max_retries} without timeout")
-                        result = func(*args, **kwargs)
+                    _logger.debug("%s attempt %d/%d %s", func_name, attempt + 1, max_retries, mode)
+                    result = call(*args, **kwargs)
 
                     if attempt > 0:
-                        _logger.info(f"{func.__name__} succeeded on attempt {attempt + 1}")
+                        _logger.info("%s succeeded on attempt %d", func_name, attempt + 1)
                     return result
 
-                except TimeoutError as e:
-                    # 处理超时异常
-                    last_exception = e
-                    _logger.log(
-                        log_level,
-                        f"{func.__name__} attempt {attempt + 1}/{max_retries} timeout after {timeout}s"
-                    )
-
-                    # 如果不是最后一次尝试，则等待后重试
-                    if attempt < max_retries - 1:
-                        delay = _calculate_delay(retry_delay, attempt, strategy, max_delay)
-                        _logger.debug(f"Retrying in {delay} seconds...")
-                        time.sleep(delay)
+                except BaseException as e:
+                    # 单一异常处理入口，按类型分流：超时 / 可重试异常 / 不可重试异常
+                    if isinstance(e, _TIMEOUT_ERRORS):
+                        _logger.log(
+                            log_level,
+                            "%s attempt %d/%d timeout after %ss", func_name, attempt + 1, max_retries, timeout
+                        )
+                    elif isinstance(e, exceptions):
+                        _logger.log(
+                            log_level,
+                            "%s attempt %d/%d failed: %s: %s",
+                            func_name, attempt + 1, max_retries, type(e).__name__, e
+                        )
+                    elif isinstance(e, Exception):
+                        # 对于不在重试范围内的异常，直接抛出
+                        # 注意：如果exceptions=Exception（默认值），这个分支永远不会执行
+                        _logger.error(
+                            "%s failed with non-retryable exception: %s: %s", func_name, type(e).__name__, e
+                        )
+                        raise
+                    else:
+                        # 任务取消、KeyboardInterrupt 等不重试也不记录，原样抛出
+                        raise
 
-                except exceptions as e:
                     last_exception = e
-                    _logger.log(
-                        log_level,
-                        f"{func.__name__} attempt {attempt + 1}/{max_retries} failed: {type(e).__name__}: {str(e)}"
-                    )
 
                     # 如果不是最后一次尝试，则等待后重试
                     if attempt < max_retries - 1:
-                        delay = _calculate_delay(retry_delay, attempt, strategy, max_delay)
-                        _logger.debug(f"Retrying in {delay} seconds...")
+                        delay = delays[attempt]
+                        _logger.debug("Retrying in %s seconds...", delay)
                         time.sleep(delay)
 
-                except Exception as e:
-                    # 对于不在重试范围内的异常，直接抛出
-                    # 注意：如果exceptions=Exception（默认值），这个分支永远不会执行
-                    _logger.error(f"{func.__name__} failed with non-retryable exception: {type(e).__name__}: {str(e)}")
-                    raise
-
             # 所有重试都失败
-            error_msg = f"{func.__name__} failed after {max_retries} attempts"
+            error_msg = f"{func_name} failed after {max_retries} attempts"
             _logger.error(error_msg)
 
             if raise_on_failure:
@@ -266,7 +281,7 @@ def retry_sync(
                 else:
                     raise RuntimeError(error_msg)
             else:
-                _logger.warning(f"Returning default value: {default_return_value}")
+                _logger.warning("Returning default value: %s", default_return_value)
                 return default_return_value
 
         return wrapper
@@ -274,6 +289,27 @@ def retry_sync(
     return decorator
 
 
+def _resolve_strategy(
+    retry_strategy: Union[str, RetryStrategy],
+    logger: logging.Logger
+) -> RetryStrategy:
+    """
+    将重试策略参数转换为枚举类型（装饰时调用一次）
+
+    :param retry_strategy: 重试策略，字符串或 RetryStrategy
+    :param logger: 策略无效时用于记录错误的日志记录器
+    :return: RetryStrategy 枚举
+    :raises ValueError: 无效的重试策略
+    """
+    if not isinstance(retry_strategy, str):
+        return retry_strategy
+    try:
+        return RetryStrategy(retry_strategy.lower())
+    except ValueError:
+        logger.error(f"Invalid retry strategy: {retry_strategy}")
+        raise ValueError(f"Invalid retry strategy: {retry_strategy}")
+
+
 def _calculate_delay(base_delay: float, attempt: int, strategy: RetryStrategy, max_delay: float = 60.0) -> float:
     """
     根据重试策略计算延迟时间（带上限限制）
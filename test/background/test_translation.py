@@ -17,17 +17,32 @@
 
 import sys
 import json
+import argparse
+import asyncio
+import re
+import hashlib
+import sqlite3
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 
 # 添加项目根目录到 Python 路径
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.client.llm import create_llm_client
+from src.client.llm.types import parse_litellm_response
+from src.prompts.chat import count_message_tokens
+from src.utils.retry_decorator import RetryStrategy, retry_async
 from src.prompts.background.translation import (
-    language_translation_system_prompt,
-    language_translation_user_prompt
+    render_language_translation_system_prompt,
+    render_language_translation_user_prompt,
+    render_language_translation_packed_user_prompt,
+    language_translation_cache_control_injection_points,
+    build_packed_translation_input,
+    parse_packed_translation_output,
 )
 from loguru import logger
 
@@ -52,6 +67,80 @@ TARGET_LANGUAGES = [
 ]
 
 
+def _write_text_files(files: List[Tuple[Path, str]], max_workers: int = 8):
+    """
+    并发写入多个文本文件（每页源文本 / 译文）
+    
+    Args:
+        files: (文件路径, 文本内容) 列表
+        max_workers: 写文件线程数
+    """
+    if not files:
+        return
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(files))) as executor:
+        # list() 消费结果，使写入异常在这里抛出
+        list(executor.map(lambda item: item[0].write_text(item[1], encoding='utf-8'), files))
+
+
+class _AsyncRateLimiter:
+    """异步速率限制器：按 requests_per_minute 均匀放行请求，避免并发请求集中触发 429"""
+    
+    def __init__(self, requests_per_minute: int):
+        self._interval = 60.0 / requests_per_minute
+        self._next_time = 0.0
+    
+    async def acquire(self):
+        """等待到下一个可用的发送时间点（单事件循环内读写之间无 await，无需加锁）"""
+        now = time.monotonic()
+        wait = self._next_time - now
+        self._next_time = max(now, self._next_time) + self._interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+# 模型输出外层的 Markdown 代码块包裹（三个及以上反引号，可带语言标记）
+_CODEFENCE_RE = re.compile(r"\A`{3,}[^\n]*\n(.*?)\n`{3,}\s*\Z", re.DOTALL)
+
+
+def _strip_codefence(content: str) -> str:
+    """移除模型输出外层的 Markdown 代码块包裹（如果有）"""
+    content = content.strip()
+    match = _CODEFENCE_RE.match(content)
+    return match.group(1) if match else content
+
+
+def _extract_text_item(item: Dict[str, Any], parts: List[str]):
+    """提取文本类型元素"""
+    text = item.get("text", "").strip()
+    if text:
+        parts.append(text)
+
+
+def _extract_table_item(item: Dict[str, Any], parts: List[str]):
+    """提取表格类型元素（标题、HTML 主体、脚注）"""
+    # 表格标题
+    table_caption = item.get("table_caption")
+    if table_caption:
+        parts.append(f"table_caption: {' '.join(table_caption)}")
+    
+    # 表格主体（HTML格式）
+    table_body = item.get("table_body", "").strip()
+    if table_body:
+        parts.append(f"table_body: {table_body}")
+    
+    # 表格脚注
+    table_footnote = item.get("table_footnote")
+    if table_footnote:
+        parts.append(f"table_footnote: {' '.join(table_footnote)}")
+
+
+# 元素类型 -> 提取函数（其余类型如图片、公式不参与翻译）
+_ITEM_EXTRACTORS = {
+    "text": _extract_text_item,
+    "table": _extract_table_item,
+}
+
+
 class TranslationTester:
     """翻译测试类"""
     
@@ -61,6 +150,9 @@ class TranslationTester:
         temperature: float = 0.3,
         max_tokens: int = 8000,
         timeout: int = 300,
+        cache_dir: Optional[str] = None,
+        requests_per_minute: Optional[int] = 500,
+        max_retries: int = 5,
     ):
         """
         初始化翻译测试器
@@ -70,6 +162,9 @@ class TranslationTester:
             temperature: 温度参数
             max_tokens: 最大token数
             timeout: 请求超时时间（秒）
+            cache_dir: 持久化翻译缓存目录（None 表示只使用进程内缓存）
+            requests_per_minute: 异步翻译的每分钟请求数上限（None表示不限速）
+            max_retries: 异步翻译遇到限流 / 超时 / 连接 / 5xx 错误时的最大尝试次数
         """
         self.model = model
         self.temperature = temperature
@@ -78,11 +173,45 @@ class TranslationTester:
         # 兼容旧字段（部分日志用）
         self.provider = model.split("/", 1)[0] if "/" in model else ""
         self.model_name = model.split("/", 1)[1] if "/" in model else model
+        # 精确匹配翻译缓存：sha256(模型|目标语言|温度|原文) -> 成功的翻译结果，
+        # 重复出现的原文（页眉、表头等固定文案）不再重复调用模型
+        self._translation_cache: Dict[str, Dict[str, Any]] = {}
+        # 持久化缓存（SQLite），跨次运行复用已翻译的结果
+        self._disk_cache: Optional[sqlite3.Connection] = None
+        if cache_dir is not None:
+            cache_path = Path(cache_dir)
+            cache_path.mkdir(parents=True, exist_ok=True)
+            self._disk_cache = sqlite3.connect(cache_path / "translation_cache.db")
+            self._disk_cache.execute(
+                "CREATE TABLE IF NOT EXISTS translation_cache (key TEXT PRIMARY KEY, result TEXT NOT NULL)"
+            )
+            logger.info(f"启用持久化翻译缓存: {cache_path}")
+        # LLM 客户端：首次翻译时创建，之后所有同步 / 异步 / batch 调用共用同一实例
+        self._client = None
+        # 异步请求限速与瞬时错误重试（重试包装首次调用时构建）
+        self._rate_limiter = _AsyncRateLimiter(requests_per_minute) if requests_per_minute else None
+        self._max_retries = max_retries
+        self._agenerate_with_retry = None
 
         logger.info(
             f"初始化翻译测试器 - Model: {model}, Timeout: {timeout}s",
         )
     
+    def close(self):
+        """释放 LLM 客户端与持久化缓存连接"""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+            self._disk_cache = None
+    
+    def __enter__(self) -> "TranslationTester":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
     def load_mineru_result(self, json_path: str) -> List[Dict[str, Any]]:
         """
         加载 mineru 解析结果
@@ -101,16 +230,71 @@ class TranslationTester:
         logger.info(f"加载完成，共 {len(content_list)} 个元素")
         return content_list
     
+    def iter_mineru_result(
+        self,
+        json_path: str,
+        page_limit: Optional[int] = None,
+        chunk_size: int = 1 << 20
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        流式读取 mineru 解析结果（逐个元素解析，不整体加载到内存）
+        
+        mineru 的 content_list 按页顺序输出，遇到第一个超出 page_limit 的元素即停止读取。
+        
+        Args:
+            json_path: content_list.json 文件路径
+            page_limit: 限制读取的页数（默认为None，表示读取所有页）
+            chunk_size: 每次从文件读取的字符数
+            
+        Yields:
+            content_list 中的元素
+        """
+        logger.info(f"流式加载 mineru 解析结果: {json_path}")
+        
+        decoder = json.JSONDecoder()
+        with open(json_path, 'r', encoding='utf-8') as f:
+            buffer = f.read(chunk_size).lstrip()
+            if not buffer.startswith("["):
+                raise ValueError(f"content_list 不是 JSON 数组: {json_path}")
+            pos = 1
+            eof = False
+            
+            while True:
+                # 跳过元素之间的空白和逗号
+                while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                    pos += 1
+                if pos < len(buffer) and buffer[pos] == "]":
+                    return
+                
+                try:
+                    if pos >= len(buffer):
+                        raise json.JSONDecodeError("缓冲区已读完", buffer, pos)
+                    item, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    # 元素跨越了缓冲区边界：丢弃已解析部分，读入更多内容后重试
+                    if eof:
+                        raise
+                    more = f.read(chunk_size)
+                    eof = not more
+                    buffer = buffer[pos:] + more
+                    pos = 0
+                    continue
+                
+                if page_limit is not None and item.get("page_idx", 0) >= page_limit:
+                    return
+                yield item
+                pos = end
+    
     def extract_text_and_tables_by_page(
         self,
-        content_list: List[Dict[str, Any]],
+        content_list: Iterable[Dict[str, Any]],
         page_limit: Optional[int] = None
     ) -> Dict[int, str]:
         """
         从 mineru 结果中按页提取文本和表格内容
         
         Args:
-            content_list: mineru 解析的内容列表
+            content_list: mineru 解析的内容列表（也可以是 iter_mineru_result 返回的迭代器）
             page_limit: 限制提取的页数（默认为None，表示提取所有页）
             
         Returns:
@@ -119,50 +303,19 @@ class TranslationTester:
         page_info = "所有页" if page_limit is None else f"前{page_limit}页"
         logger.info(f"开始按页提取文本和表格内容（页数限制: {page_info}）")
         
-        # 按页组织内容
-        pages_content = {}
+        # 只提取指定页数的内容（如果page_limit为None则提取所有页）
+        items = content_list if page_limit is None else (
+            item for item in content_list if item.get("page_idx", 0) < page_limit
+        )
         
-        for item in content_list:
-            page_idx = item.get("page_idx", 0)
-            
-            # 只提取指定页数的内容（如果page_limit为None则提取所有页）
-            if page_limit is not None and page_idx >= page_limit:
-                continue
-            
-            # 初始化该页的内容列表
-            if page_idx not in pages_content:
-                pages_content[page_idx] = []
-            
-            item_type = item.get("type")
-            
-            # 提取文本类型
-            if item_type == "text":
-                text = item.get("text", "").strip()
-                if text:
-                    pages_content[page_idx].append(text)
-                    logger.debug(f"页{page_idx}: 提取文本: {text[:50]}...")
-            
-            # 提取表格类型
-            elif item_type == "table":
-                # 表格标题
-                table_caption = item.get("table_caption", [])
-                if table_caption:
-                    caption_text = " ".join(table_caption)
-                    pages_content[page_idx].append(f"table_caption: {caption_text}")
-                    logger.debug(f"页{page_idx}: 提取表格标题: {caption_text[:50]}...")
-                
-                # 表格主体（HTML格式）
-                table_body = item.get("table_body", "").strip()
-                if table_body:
-                    pages_content[page_idx].append(f"table_body: {table_body}")
-                    logger.debug(f"页{page_idx}: 提取表格主体: {table_body[:100]}...")
-                
-                # 表格脚注
-                table_footnote = item.get("table_footnote", [])
-                if table_footnote:
-                    footnote_text = " ".join(table_footnote)
-                    pages_content[page_idx].append(f"table_footnote: {footnote_text}")
-                    logger.debug(f"页{page_idx}: 提取表格脚注: {footnote_text[:50]}...")
+        # 按页组织内容（出现过的页都保留，即使没有可提取的内容）
+        pages_content: Dict[int, List[str]] = defaultdict(list)
+        
+        for item in items:
+            parts = pages_content[item.get("page_idx", 0)]
+            extractor = _ITEM_EXTRACTORS.get(item.get("type"))
+            if extractor is not None:
+                extractor(item, parts)
         
         # 拼接每页的内容
         pages_text = {}
@@ -174,6 +327,207 @@ class TranslationTester:
         logger.info(f"总共提取 {len(pages_text)} 页内容")
         return pages_text
     
+    def _get_client(self):
+        """
+        获取 LLM 客户端（首次调用时创建，之后复用）
+        
+        Returns:
+            LLMClient 实例
+        """
+        if self._client is None:
+            self._client = create_llm_client(
+                model=self.model,
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+                timeout=self.timeout,
+                extra_params={
+                    "cache_control_injection_points": language_translation_cache_control_injection_points,
+                },
+            )
+        return self._client
+    
+    async def _agenerate(self, messages: List[Dict[str, str]]) -> Any:
+        """
+        异步调用模型：每次尝试前按速率限制排队，限流 / 超时 / 连接 / 5xx 错误指数退避重试
+        
+        Args:
+            messages: OpenAI 格式的 messages 列表
+            
+        Returns:
+            LLMResponse
+        """
+        if self._agenerate_with_retry is None:
+            import litellm
+            
+            @retry_async(
+                max_retries=self._max_retries,
+                retry_delay=1.0,
+                retry_strategy=RetryStrategy.EXPONENTIAL,
+                exceptions=(
+                    litellm.RateLimitError,
+                    litellm.Timeout,
+                    litellm.APIConnectionError,
+                    litellm.InternalServerError,
+                    litellm.ServiceUnavailableError,
+                ),
+                max_delay=30.0
+            )
+            async def _call(messages: List[Dict[str, str]]) -> Any:
+                if self._rate_limiter is not None:
+                    await self._rate_limiter.acquire()
+                return await self._get_client().agenerate(messages=messages)
+            
+            self._agenerate_with_retry = _call
+        return await self._agenerate_with_retry(messages)
+    
+    def _build_messages(
+        self,
+        text: str,
+        target_language_code: str,
+        target_language_name: str
+    ) -> List[Dict[str, str]]:
+        """
+        构建翻译请求的 messages
+        
+        Args:
+            text: 待翻译的文本
+            target_language_code: 目标语言代码（如 zh-CN）
+            target_language_name: 目标语言名称（如 Simplified Chinese）
+            
+        Returns:
+            OpenAI 格式的 messages 列表
+        """
+        # 构建系统提示词
+        system_prompt = render_language_translation_system_prompt(
+            target_language_code=target_language_code,
+            target_language_name=target_language_name
+        )
+        
+        # 构建用户提示词
+        user_prompt = render_language_translation_user_prompt(text)
+        
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
+    
+    def _build_result(
+        self,
+        response: Any,
+        target_language_code: str,
+        target_language_name: str
+    ) -> Dict[str, Any]:
+        """
+        处理模型响应，生成翻译结果字典
+        
+        Args:
+            response: LLMResponse
+            target_language_code: 目标语言代码
+            target_language_name: 目标语言名称
+            
+        Returns:
+            翻译结果字典
+        """
+        # 提取翻译结果（移除代码块标记）
+        translated_content = _strip_codefence(response.content)
+        
+        logger.info(
+            f"翻译完成 - Token使用: {response.usage.total_tokens}, "
+            f"翻译内容长度: {len(translated_content)} 字符"
+        )
+        
+        # 打印翻译内容预览（前500字符）
+        print("\n" + "=" * 80)
+        print(f"翻译语言: {target_language_name} ({target_language_code})")
+        print(f"模型: {response.model}")
+        print(f"Token使用: 提示={response.usage.prompt_tokens}, "
+              f"完成={response.usage.completion_tokens}, "
+              f"总计={response.usage.total_tokens}")
+        print("-" * 80)
+        print("翻译内容预览（前500字符）:")
+        print(translated_content[:500])
+        if len(translated_content) > 500:
+            print(f"\n... (还有 {len(translated_content) - 500} 个字符)")
+        print("=" * 80 + "\n")
+        
+        return {
+            "target_language_code": target_language_code,
+            "target_language_name": target_language_name,
+            "translated_content": translated_content,
+            "model": response.model,
+            "tokens_used": response.usage.total_tokens,
+            "prompt_tokens": response.usage.prompt_tokens,
+            "completion_tokens": response.usage.completion_tokens,
+            "finish_reason": response.finish_reason
+        }
+    
+    def _build_error(
+        self,
+        error: BaseException,
+        target_language_code: str,
+        target_language_name: str
+    ) -> Dict[str, Any]:
+        """
+        记录翻译失败并生成错误结果字典
+        
+        Args:
+            error: 异常
+            target_language_code: 目标语言代码
+            target_language_name: 目标语言名称
+            
+        Returns:
+            包含 error 字段的结果字典
+        """
+        logger.error(f"翻译失败: {error}")
+        
+        # 打印错误信息
+        print("\n" + "=" * 80)
+        print(f"❌ 翻译失败: {target_language_name} ({target_language_code})")
+        print(f"错误信息: {str(error)}")
+        print("=" * 80 + "\n")
+        
+        return {
+            "target_language_code": target_language_code,
+            "target_language_name": target_language_name,
+            "error": str(error)
+        }
+    
+    def _cache_key(self, text: str, target_language_code: str) -> str:
+        """翻译缓存键：模型、目标语言、温度任一变化都不复用旧结果"""
+        return hashlib.sha256(
+            f"{self.model}|{target_language_code}|{self.temperature}|{text}".encode("utf-8")
+        ).hexdigest()
+    
+    def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        查询翻译缓存（先进程内，再持久化缓存）
+        
+        Args:
+            key: 缓存键
+            
+        Returns:
+            命中时返回翻译结果，否则返回 None
+        """
+        cached = self._translation_cache.get(key)
+        if cached is None and self._disk_cache is not None:
+            row = self._disk_cache.execute(
+                "SELECT result FROM translation_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                cached = json.loads(row[0])
+                self._translation_cache[key] = cached
+        return cached
+    
+    def _cache_set(self, key: str, result: Dict[str, Any]):
+        """写入翻译缓存（仅缓存成功的翻译结果）"""
+        self._translation_cache[key] = result
+        if self._disk_cache is not None:
+            with self._disk_cache:
+                self._disk_cache.execute(
+                    "INSERT OR REPLACE INTO translation_cache (key, result) VALUES (?, ?)",
+                    (key, json.dumps(result, ensure_ascii=False))
+                )
+    
     def translate_text(
         self,
         text: str,
@@ -193,182 +547,622 @@ class TranslationTester:
         """
         logger.info(f"开始翻译到 {target_language_name} ({target_language_code})")
         
-        # 构建系统提示词
-        system_prompt = language_translation_system_prompt.format(
-            TARGET_LANGUAGE_CODE=target_language_code,
-            TARGET_LANGUAGE_NAME=target_language_name
-        )
-        
-        # 构建用户提示词
-        user_prompt = language_translation_user_prompt.format(
-            input_text=text
-        )
+        cache_key = self._cache_key(text, target_language_code)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.info(f"命中翻译缓存，跳过模型调用: {target_language_code}")
+            return cached
         
-        # 创建客户端并进行翻译
         try:
-            with create_llm_client(
-                model=self.model,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                timeout=self.timeout,
-            ) as client:
-                response = client.generate(
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt},
-                    ],
-                )
-                
-                # 提取翻译结果（移除代码块标记）
-                translated_content = response.content.strip()
-                
-                # 移除 Markdown 代码块包裹（如果有）
-                if translated_content.startswith("````"):
-                    lines = translated_content.split("\n")
-                    # 移除第一行和最后一行的四个反引号
-                    if len(lines) > 2:
-                        translated_content = "\n".join(lines[1:-1])
-                elif translated_content.startswith("```"):
-                    lines = translated_content.split("\n")
-                    # 移除第一行和最后一行的三个反引号
-                    if len(lines) > 2:
-                        translated_content = "\n".join(lines[1:-1])
-                
-                logger.info(
-                    f"翻译完成 - Token使用: {response.usage.total_tokens}, "
-                    f"翻译内容长度: {len(translated_content)} 字符"
-                )
-                
-                # 打印翻译内容预览（前500字符）
-                print("\n" + "=" * 80)
-                print(f"翻译语言: {target_language_name} ({target_language_code})")
-                print(f"模型: {response.model}")
-                print(f"Token使用: 提示={response.usage.prompt_tokens}, "
-                      f"完成={response.usage.completion_tokens}, "
-                      f"总计={response.usage.total_tokens}")
-                print("-" * 80)
-                print("翻译内容预览（前500字符）:")
-                print(translated_content[:500])
-                if len(translated_content) > 500:
-                    print(f"\n... (还有 {len(translated_content) - 500} 个字符)")
-                print("=" * 80 + "\n")
-                
-                return {
-                    "target_language_code": target_language_code,
-                    "target_language_name": target_language_name,
-                    "translated_content": translated_content,
-                    "model": response.model,
-                    "tokens_used": response.usage.total_tokens,
-                    "prompt_tokens": response.usage.prompt_tokens,
-                    "completion_tokens": response.usage.completion_tokens,
-                    "finish_reason": response.finish_reason
-                }
+            response = self._get_client().generate(
+                messages=self._build_messages(text, target_language_code, target_language_name),
+            )
+            result = self._build_result(response, target_language_code, target_language_name)
+            self._cache_set(cache_key, result)
+            return result
         
         except Exception as e:
-            logger.error(f"翻译失败: {e}")
+            return self._build_error(e, target_language_code, target_language_name)
+    
+    async def atranslate_text(
+        self,
+        text: str,
+        target_language_code: str,
+        target_language_name: str
+    ) -> Dict[str, Any]:
+        """
+        翻译文本到目标语言（异步版本，供并发翻译使用）
+        
+        Args:
+            text: 待翻译的文本
+            target_language_code: 目标语言代码（如 zh-CN）
+            target_language_name: 目标语言名称（如 Simplified Chinese）
             
-            # 打印错误信息
-            print("\n" + "=" * 80)
-            print(f"❌ 翻译失败: {target_language_name} ({target_language_code})")
-            print(f"错误信息: {str(e)}")
-            print("=" * 80 + "\n")
+        Returns:
+            翻译结果字典，包含翻译内容、token使用等信息
+        """
+        logger.info(f"开始翻译到 {target_language_name} ({target_language_code})")
+        
+        cache_key = self._cache_key(text, target_language_code)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.info(f"命中翻译缓存，跳过模型调用: {target_language_code}")
+            return cached
+        
+        try:
+            response = await self._agenerate(
+                self._build_messages(text, target_language_code, target_language_name)
+            )
+            result = self._build_result(response, target_language_code, target_language_name)
+            self._cache_set(cache_key, result)
+            return result
+        
+        except Exception as e:
+            return self._build_error(e, target_language_code, target_language_name)
+    
+    async def atranslate_packed(
+        self,
+        texts: List[str],
+        target_language_code: str,
+        target_language_name: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        把多个短文本打包进一次请求翻译（分隔符协议见 language_translation_packed_user_prompt）
+        
+        节省每个请求重复的系统提示词 token 与往返耗时；Token 使用量按文本数均摊到各结果。
+        
+        Args:
+            texts: 待翻译的文本列表
+            target_language_code: 目标语言代码（如 zh-CN）
+            target_language_name: 目标语言名称（如 Simplified Chinese）
             
-            return {
+        Returns:
+            与 texts 同序的翻译结果列表；请求失败或输出无法按分隔符拆分时返回 None，
+            由调用方回退为逐段翻译
+        """
+        logger.info(f"开始打包翻译 {len(texts)} 段文本到 {target_language_name} ({target_language_code})")
+        
+        messages = self._build_messages(texts[0], target_language_code, target_language_name)
+        messages[1]["content"] = render_language_translation_packed_user_prompt(
+            build_packed_translation_input(texts)
+        )
+        
+        try:
+            response = await self._agenerate(messages)
+        except Exception as e:
+            logger.warning(f"打包翻译失败，回退为逐段翻译: {e}")
+            return None
+        
+        segments = parse_packed_translation_output(_strip_codefence(response.content), len(texts))
+        if segments is None:
+            logger.warning(f"打包翻译输出无法按分隔符拆分，回退为逐段翻译: {target_language_code}")
+            return None
+        
+        logger.info(
+            f"打包翻译完成 - Token使用: {response.usage.total_tokens}, 文本段数: {len(texts)}"
+        )
+        
+        usage = response.usage
+        results = []
+        for k, (text, translated_content) in enumerate(zip(texts, segments)):
+            # 均摊 token 使用量，余数计入第一段，保证各段之和等于实际用量
+            first = k == 0
+            result = {
                 "target_language_code": target_language_code,
                 "target_language_name": target_language_name,
-                "error": str(e)
+                "translated_content": translated_content,
+                "model": response.model,
+                "tokens_used": usage.total_tokens // len(texts) + (usage.total_tokens % len(texts) if first else 0),
+                "prompt_tokens": usage.prompt_tokens // len(texts) + (usage.prompt_tokens % len(texts) if first else 0),
+                "completion_tokens": usage.completion_tokens // len(texts) + (usage.completion_tokens % len(texts) if first else 0),
+                "finish_reason": response.finish_reason
             }
+            self._cache_set(self._cache_key(text, target_language_code), result)
+            results.append(result)
+        return results
     
     def run_translation_tests(
         self,
         mineru_json_path: str,
         output_dir: str,
         page_limit: Optional[int] = None,
-        language_limit: Optional[int] = None
+        language_limit: Optional[int] = None,
+        max_concurrent: int = 8,
+        chunk_max_tokens: Optional[int] = 2000,
+        pack_max_tokens: Optional[int] = 2000
     ):
         """
-        运行翻译测试
+        运行翻译测试（同步入口，内部并发执行）
         
         Args:
             mineru_json_path: mineru 解析结果的 content_list.json 路径
             output_dir: 输出目录
             page_limit: 限制提取的页数（默认为None，表示提取所有页）
             language_limit: 限制测试的语言数量（None表示测试所有语言）
+            max_concurrent: 同时进行的翻译请求数上限
+            chunk_max_tokens: 每个翻译分块的 token 预算（None表示整页翻译）
+            pack_max_tokens: 短分块打包进同一请求的 token 预算（None表示不打包）
         """
-        # 打印测试开始信息
+        asyncio.run(self.arun_translation_tests(
+            mineru_json_path=mineru_json_path,
+            output_dir=output_dir,
+            page_limit=page_limit,
+            language_limit=language_limit,
+            max_concurrent=max_concurrent,
+            chunk_max_tokens=chunk_max_tokens,
+            pack_max_tokens=pack_max_tokens
+        ))
+    
+    def _print_test_header(self, mode: str, mineru_json_path: str):
+        """打印测试开始信息"""
         print("\n" + "🚀" * 40)
         print("🌐 翻译测试开始")
         print(f"🤖 模型: {self.model}")
         print(f"⏱️  超时时间: {self.timeout}秒")
         print(f"🎯 最大Token: {self.max_tokens}")
+        print(f"🔀 执行方式: {mode}")
         print(f"📄 源文件: {mineru_json_path}")
         print("🚀" * 40 + "\n")
         
         logger.info("=" * 80)
         logger.info("开始翻译测试")
         logger.info("=" * 80)
+    
+    def _prepare_pages(
+        self,
+        mineru_json_path: str,
+        output_path: Path,
+        page_limit: Optional[int]
+    ) -> Dict[int, str]:
+        """
+        加载 mineru 结果、按页提取文本并保存每页源文本
         
+        Args:
+            mineru_json_path: mineru 解析结果的 content_list.json 路径
+            output_path: 输出目录
+            page_limit: 限制提取的页数
+            
+        Returns:
+            字典，key为页码，value为该页的拼接文本内容
+        """
         # 创建输出目录
-        output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
-        # 1. 加载 mineru 结果
-        content_list = self.load_mineru_result(mineru_json_path)
+        # 1. 流式加载 mineru 结果（超出 page_limit 即停止读取）
+        content_items = self.iter_mineru_result(mineru_json_path, page_limit)
         
         # 2. 按页提取文本和表格
-        pages_text = self.extract_text_and_tables_by_page(content_list, page_limit)
+        pages_text = self.extract_text_and_tables_by_page(content_items, page_limit)
         
         # 保存每页的源文本
-        for page_idx, page_text in pages_text.items():
-            source_file = output_path / f"source_text_page_{page_idx}.txt"
-            with open(source_file, 'w', encoding='utf-8') as f:
-                f.write(page_text)
-            logger.info(f"页{page_idx}源文本已保存: {source_file}")
+        _write_text_files([
+            (output_path / f"source_text_page_{page_idx}.txt", page_text)
+            for page_idx, page_text in pages_text.items()
+        ])
+        logger.info(f"每页源文本已保存: {output_path}")
         
         total_chars = sum(len(text) for text in pages_text.values())
         print(f"📝 源文本已保存: {len(pages_text)} 页")
         print(f"📊 总长度: {total_chars} 字符\n")
         
-        # 3. 对每种语言进行翻译测试
+        return pages_text
+    
+    def _select_languages(self, language_limit: Optional[int]) -> List[Dict[str, str]]:
+        """按 language_limit 截取待测试的目标语言"""
         test_languages = TARGET_LANGUAGES[:language_limit] if language_limit else TARGET_LANGUAGES
         print(f"🎯 将测试 {len(test_languages)} 种语言: {', '.join([lang['code'] for lang in test_languages])}\n")
+        return test_languages
+    
+    def _chunk_page(self, text: str, max_tokens: int = 2000) -> List[str]:
+        """
+        按段落把页面文本贪心打包为不超过 token 预算的分块
+        
+        段落（文本 / 表格单元）在 extract_text_and_tables_by_page 中以 "\n\n" 分隔，
+        分块只在段落边界切分，保持原有顺序；单个段落超出预算时独立成块。
+        
+        Args:
+            text: 页面文本
+            max_tokens: 每个分块的 token 预算
+            
+        Returns:
+            分块列表（按原文顺序）
+        """
+        chunks: List[str] = []
+        current: List[str] = []
+        current_tokens = 0
+        
+        for paragraph in text.split("\n\n"):
+            paragraph_tokens = count_message_tokens(
+                [{"role": "user", "content": paragraph}], model=self.model
+            )
+            if current and current_tokens + paragraph_tokens > max_tokens:
+                chunks.append("\n\n".join(current))
+                current = []
+                current_tokens = 0
+            current.append(paragraph)
+            current_tokens += paragraph_tokens
+        
+        if current:
+            chunks.append("\n\n".join(current))
+        return chunks
+    
+    def _merge_chunk_results(
+        self,
+        chunk_results: List[Dict[str, Any]],
+        target_language_code: str,
+        target_language_name: str
+    ) -> Dict[str, Any]:
+        """
+        把同一页各分块的翻译结果按顺序合并为整页结果
+        
+        Args:
+            chunk_results: 按原文顺序排列的分块翻译结果
+            target_language_code: 目标语言代码
+            target_language_name: 目标语言名称
+            
+        Returns:
+            整页翻译结果字典；任一分块失败时返回错误结果
+        """
+        if len(chunk_results) == 1:
+            return chunk_results[0]
+        
+        errors = [r["error"] for r in chunk_results if "error" in r]
+        if errors:
+            return {
+                "target_language_code": target_language_code,
+                "target_language_name": target_language_name,
+                "error": "; ".join(errors)
+            }
+        
+        finish_reasons = [r["finish_reason"] for r in chunk_results]
+        return {
+            "target_language_code": target_language_code,
+            "target_language_name": target_language_name,
+            "translated_content": "\n\n".join(r["translated_content"] for r in chunk_results),
+            "model": chunk_results[0]["model"],
+            "tokens_used": sum(r["tokens_used"] for r in chunk_results),
+            "prompt_tokens": sum(r["prompt_tokens"] for r in chunk_results),
+            "completion_tokens": sum(r["completion_tokens"] for r in chunk_results),
+            "finish_reason": "length" if "length" in finish_reasons else finish_reasons[0],
+            "chunks": len(chunk_results)
+        }
+    
+    async def arun_translation_tests(
+        self,
+        mineru_json_path: str,
+        output_dir: str,
+        page_limit: Optional[int] = None,
+        language_limit: Optional[int] = None,
+        max_concurrent: int = 8,
+        chunk_max_tokens: Optional[int] = 2000,
+        pack_max_tokens: Optional[int] = 2000
+    ):
+        """
+        运行翻译测试
+        
+        长页面先按段落切成不超过 chunk_max_tokens 的分块，所有 (语言, 页, 分块)
+        的翻译请求并发发出（信号量限制同时在途的请求数），再按原顺序拼回整页。
+        请求按分块长度从长到短提交，长分块尽早开始，避免最后只剩一个长请求拖尾。
+        总长度不超过 pack_max_tokens 的连续短分块打包进同一请求，减少重复的系统提示词开销。
+        
+        Args:
+            mineru_json_path: mineru 解析结果的 content_list.json 路径
+            output_dir: 输出目录
+            page_limit: 限制提取的页数（默认为None，表示提取所有页）
+            language_limit: 限制测试的语言数量（None表示测试所有语言）
+            max_concurrent: 同时进行的翻译请求数上限
+            chunk_max_tokens: 每个翻译分块的 token 预算（None表示整页翻译）
+            pack_max_tokens: 短分块打包进同一请求的 token 预算（None表示不打包）
+        """
+        self._print_test_header(f"在线并发（最大并发 {max_concurrent}）", mineru_json_path)
+        
+        output_path = Path(output_dir)
+        pages_text = self._prepare_pages(mineru_json_path, output_path, page_limit)
+        
+        # 3. 对每种语言、每一页的每个分块并发进行翻译
+        test_languages = self._select_languages(language_limit)
+        
+        # 相同文本（重复页、页眉页脚等固定段落）按摘要去重，每种语言只翻译一次
+        chunk_texts: Dict[bytes, str] = {}
+        page_chunk_digests: Dict[int, List[bytes]] = {}
+        for page_idx, page_text in pages_text.items():
+            chunks = [page_text] if chunk_max_tokens is None else self._chunk_page(page_text, chunk_max_tokens)
+            digests = []
+            for chunk_text in chunks:
+                digest = hashlib.sha256(chunk_text.encode("utf-8")).digest()
+                chunk_texts.setdefault(digest, chunk_text)
+                digests.append(digest)
+            page_chunk_digests[page_idx] = digests
         
+        total_chunks = sum(len(digests) for digests in page_chunk_digests.values())
+        logger.info(f"分块总数: {total_chunks}, 去重后: {len(chunk_texts)}")
+        
+        sem = asyncio.Semaphore(max_concurrent)
+        
+        async def _translate_chunk(lang: Dict[str, str], digest: bytes) -> Dict[str, Any]:
+            async with sem:
+                chunk_text = chunk_texts[digest]
+                print(f"\n  📄 正在翻译分块到 {lang['code']} ({len(chunk_text)} 字符)...")
+                logger.info(f"翻译分块到 {lang['name']}（{len(chunk_text)} 字符）")
+                return await self.atranslate_text(
+                    text=chunk_text,
+                    target_language_code=lang["code"],
+                    target_language_name=lang["name"]
+                )
+        
+        chunk_tokens = {} if pack_max_tokens is None else {
+            digest: count_message_tokens([{"role": "user", "content": text}], model=self.model)
+            for digest, text in chunk_texts.items()
+        }
+        
+        def _pack_chunks(lang: Dict[str, str]) -> List[List[bytes]]:
+            """按 token 预算把连续的短分块贪心打包（已命中缓存或超出预算的分块单独成包）"""
+            if pack_max_tokens is None:
+                return [[digest] for digest in chunk_texts]
+            packs: List[List[bytes]] = []
+            current: List[bytes] = []
+            current_tokens = 0
+            for digest, text in chunk_texts.items():
+                if (
+                    chunk_tokens[digest] > pack_max_tokens
+                    or self._cache_get(self._cache_key(text, lang["code"])) is not None
+                ):
+                    packs.append([digest])
+                    continue
+                if current and current_tokens + chunk_tokens[digest] > pack_max_tokens:
+                    packs.append(current)
+                    current = []
+                    current_tokens = 0
+                current.append(digest)
+                current_tokens += chunk_tokens[digest]
+            if current:
+                packs.append(current)
+            return packs
+        
+        async def _translate_pack(lang: Dict[str, str], digests: List[bytes]) -> List[Dict[str, Any]]:
+            if len(digests) == 1:
+                return [await _translate_chunk(lang, digests[0])]
+            async with sem:
+                print(f"\n  📦 正在打包翻译 {len(digests)} 个分块到 {lang['code']}...")
+                results = await self.atranslate_packed(
+                    texts=[chunk_texts[digest] for digest in digests],
+                    target_language_code=lang["code"],
+                    target_language_name=lang["name"]
+                )
+            if results is None:
+                # 打包失败，回退为逐块翻译
+                results = await asyncio.gather(*[_translate_chunk(lang, digest) for digest in digests])
+            return results
+        
+        # 记录 (语言, 分块包) 任务，按包内文本长度从长到短提交；结果与之一一对应
+        task_keys = sorted(
+            ((lang, digests) for lang in test_languages for digests in _pack_chunks(lang)),
+            key=lambda k: sum(len(chunk_texts[digest]) for digest in k[1]),
+            reverse=True
+        )
+        results = await asyncio.gather(
+            *[_translate_pack(lang, digests) for lang, digests in task_keys],
+            return_exceptions=True
+        )
+        
+        chunk_results: Dict[Tuple[str, bytes], Dict[str, Any]] = {}
+        for (lang, digests), pack_results in zip(task_keys, results):
+            if isinstance(pack_results, BaseException):
+                pack_results = [self._build_error(pack_results, lang["code"], lang["name"])] * len(digests)
+            for digest, result in zip(digests, pack_results):
+                chunk_results[(lang["code"], digest)] = result
+        
+        # 按原顺序拼回整页
+        results_by_key: Dict[Tuple[str, int], Dict[str, Any]] = {
+            (lang["code"], page_idx): self._merge_chunk_results(
+                [chunk_results[(lang["code"], digest)] for digest in digests],
+                lang["code"],
+                lang["name"]
+            )
+            for lang in test_languages
+            for page_idx, digests in page_chunk_digests.items()
+        }
+        
+        self._save_results(output_path, pages_text, test_languages, results_by_key, page_limit)
+    
+    def run_translation_tests_batch(
+        self,
+        mineru_json_path: str,
+        output_dir: str,
+        page_limit: Optional[int] = None,
+        language_limit: Optional[int] = None,
+        poll_interval: float = 10.0,
+        max_poll_interval: float = 300.0
+    ):
+        """
+        运行翻译测试（Batch API 离线批量模式）
+        
+        把全部 (语言, 页) 请求打包成一个 JSONL 文件，一次上传并创建 batch，
+        轮询至完成后下载全部结果；费用约为在线调用的一半，且不受在线限流约束，
+        适合大文档 / 夜间任务。小规模测试仍建议使用在线并发模式。
+        
+        Args:
+            mineru_json_path: mineru 解析结果的 content_list.json 路径
+            output_dir: 输出目录
+            page_limit: 限制提取的页数（默认为None，表示提取所有页）
+            language_limit: 限制测试的语言数量（None表示测试所有语言）
+            poll_interval: 初始轮询间隔（秒），之后指数退避
+            max_poll_interval: 轮询间隔上限（秒）
+        """
+        self._print_test_header("Batch API", mineru_json_path)
+        
+        output_path = Path(output_dir)
+        pages_text = self._prepare_pages(mineru_json_path, output_path, page_limit)
+        test_languages = self._select_languages(language_limit)
+        languages_by_code = {lang["code"]: lang for lang in test_languages}
+        
+        # 3. 构建 batch 请求文件：每个未命中缓存的 (语言, 页) 一行，custom_id 用于回填结果；
+        #    同一语言下文本相同的页只请求一次，结果回填给重复页
+        results_by_key: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        cache_keys: Dict[Tuple[str, int], str] = {}
+        requested: Dict[str, Tuple[str, int]] = {}
+        duplicates: List[Tuple[Tuple[str, int], Tuple[str, int]]] = []
+        requests_file = output_path / "batch_requests.jsonl"
+        with open(requests_file, 'w', encoding='utf-8') as f:
+            for lang in test_languages:
+                for page_idx in sorted(pages_text.keys()):
+                    cache_key = self._cache_key(pages_text[page_idx], lang["code"])
+                    cached = self._cache_get(cache_key)
+                    if cached is not None:
+                        results_by_key[(lang["code"], page_idx)] = cached
+                        continue
+                    if cache_key in requested:
+                        duplicates.append(((lang["code"], page_idx), requested[cache_key]))
+                        continue
+                    requested[cache_key] = (lang["code"], page_idx)
+                    cache_keys[(lang["code"], page_idx)] = cache_key
+                    f.write(json.dumps({
+                        "custom_id": f"{lang['code']}:{page_idx}",
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": {
+                            "model": self.model_name,
+                            "messages": self._build_messages(
+                                pages_text[page_idx], lang["code"], lang["name"]
+                            ),
+                            "temperature": self.temperature,
+                            "max_tokens": self.max_tokens,
+                        },
+                    }, ensure_ascii=False) + "\n")
+        logger.info(
+            f"Batch 请求文件已生成: {requests_file}, "
+            f"请求数: {len(cache_keys)}, 缓存命中: {len(results_by_key)}, 重复页: {len(duplicates)}"
+        )
+        
+        # 4. 提交 batch 并下载结果，按 custom_id 回填
+        if cache_keys:
+            output_text = self._submit_batch(requests_file, poll_interval, max_poll_interval)
+            for line in output_text.splitlines():
+                if not line.strip():
+                    continue
+                item = json.loads(line)
+                code, page_idx = item["custom_id"].rsplit(":", 1)
+                lang = languages_by_code[code]
+                response = item.get("response") or {}
+                if item.get("error") or response.get("status_code") != 200:
+                    error = item.get("error") or response.get("body")
+                    result = self._build_error(RuntimeError(str(error)), code, lang["name"])
+                else:
+                    result = self._build_result(
+                        parse_litellm_response(response["body"]), code, lang["name"]
+                    )
+                    self._cache_set(cache_keys[(code, int(page_idx))], result)
+                results_by_key[(code, int(page_idx))] = result
+        
+        for key, source_key in duplicates:
+            if source_key in results_by_key:
+                results_by_key[key] = results_by_key[source_key]
+        
+        # 输出文件中缺失的请求（batch 部分失败）记为错误
+        for lang in test_languages:
+            for page_idx in pages_text:
+                if (lang["code"], page_idx) not in results_by_key:
+                    results_by_key[(lang["code"], page_idx)] = self._build_error(
+                        RuntimeError(f"Batch 输出缺少结果: {lang['code']}:{page_idx}"),
+                        lang["code"],
+                        lang["name"]
+                    )
+        
+        self._save_results(output_path, pages_text, test_languages, results_by_key, page_limit)
+    
+    def _submit_batch(
+        self,
+        requests_file: Path,
+        poll_interval: float,
+        max_poll_interval: float
+    ) -> str:
+        """
+        上传请求文件、创建 batch 并轮询至结束，返回输出文件内容
+        
+        LiteLLM 透传到 OpenAI 兼容的 /v1/files、/v1/batches 接口
+        （api_base / api_key 与在线调用的客户端一致）。
+        
+        Args:
+            requests_file: batch 请求 JSONL 文件
+            poll_interval: 初始轮询间隔（秒），之后指数退避
+            max_poll_interval: 轮询间隔上限（秒）
+            
+        Returns:
+            batch 输出文件的 JSONL 文本
+            
+        Raises:
+            RuntimeError: batch 未成功完成
+        """
+        import litellm
+        
+        client = self._get_client()
+        provider_kwargs = {
+            "custom_llm_provider": "openai",
+            "api_base": client.api_base,
+            "api_key": client.api_key,
+        }
+        with open(requests_file, 'rb') as f:
+            input_file = litellm.create_file(file=f, purpose="batch", **provider_kwargs)
+        batch = litellm.create_batch(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+            **provider_kwargs
+        )
+        logger.info(f"Batch 已创建: {batch.id}")
+        print(f"📦 Batch 已创建: {batch.id}\n")
+        
+        # 指数退避轮询，直到 batch 结束
+        interval = poll_interval
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(interval)
+            interval = min(interval * 2, max_poll_interval)
+            batch = litellm.retrieve_batch(batch_id=batch.id, **provider_kwargs)
+            logger.info(f"Batch 状态: {batch.status}")
+        
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"Batch 未成功完成: id={batch.id}, status={batch.status}")
+        
+        return litellm.file_content(file_id=batch.output_file_id, **provider_kwargs).text
+    
+    def _save_results(
+        self,
+        output_path: Path,
+        pages_text: Dict[int, str],
+        test_languages: List[Dict[str, str]],
+        results_by_key: Dict[Tuple[str, int], Dict[str, Any]],
+        page_limit: Optional[int]
+    ):
+        """
+        按语言汇总每页翻译结果，保存译文、测试摘要并打印统计
+        
+        Args:
+            output_path: 输出目录
+            pages_text: 每页源文本
+            test_languages: 测试的目标语言
+            results_by_key: (语言代码, 页码) -> 翻译结果
+            page_limit: 页数限制（写入摘要）
+        """
         all_results = []
+        translation_files: List[Tuple[Path, str]] = []
         
         for i, lang in enumerate(test_languages, 1):
-            # 打印测试开始信息
-            print("\n" + "🌍" * 40)
-            print(f"📝 开始测试 {i}/{len(test_languages)}: {lang['name']} ({lang['code']})")
-            print("🌍" * 40 + "\n")
-            
             logger.info(f"\n{'=' * 80}")
             logger.info(f"测试 {i}/{len(test_languages)}: {lang['name']} ({lang['code']})")
             logger.info(f"{'=' * 80}")
             
-            # 对每一页进行翻译
+            # 汇总该语言每一页的翻译结果
             page_results = {}
             all_pages_success = True
             
             for page_idx in sorted(pages_text.keys()):
-                page_text = pages_text[page_idx]
-                
-                print(f"\n  📄 正在翻译第 {page_idx} 页 ({len(page_text)} 字符)...")
-                logger.info(f"翻译第 {page_idx} 页到 {lang['name']}")
-                
-                # 翻译该页
-                result = self.translate_text(
-                    text=page_text,
-                    target_language_code=lang["code"],
-                    target_language_name=lang["name"]
-                )
-                
+                result = results_by_key[(lang["code"], page_idx)]
                 page_results[page_idx] = result
                 
                 # 保存该页的翻译结果
                 if "error" not in result:
                     translation_file = output_path / f"translated_{lang['code']}_page_{page_idx}.txt"
-                    with open(translation_file, 'w', encoding='utf-8') as f:
-                        f.write(result["translated_content"])
+                    translation_files.append((translation_file, result["translated_content"]))
                     logger.info(f"✅ 页{page_idx}翻译结果已保存: {translation_file}")
                     print(f"  ✅ 页{page_idx}已保存: {translation_file}\n")
                 else:
@@ -386,10 +1180,12 @@ class TranslationTester:
             
             all_results.append(combined_result)
         
+        _write_text_files(translation_files)
+        
         # 4. 保存完整的测试结果
         summary_file = output_path / "translation_summary.json"
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump({
+        summary_file.write_text(
+            json.dumps({
                 "model": self.model,
                 "temperature": self.temperature,
                 "max_tokens": self.max_tokens,
@@ -398,7 +1194,9 @@ class TranslationTester:
                 "page_limit": page_limit,
                 "test_languages": [lang["code"] for lang in test_languages],
                 "results": all_results
-            }, f, ensure_ascii=False, indent=2)
+            }, ensure_ascii=False, indent=2),
+            encoding='utf-8'
+        )
         
         # 统计信息
         success_count = sum(1 for r in all_results if r.get("all_pages_success", False))
@@ -436,6 +1234,30 @@ class TranslationTester:
 
 def main():
     """主函数"""
+    parser = argparse.ArgumentParser(description="文本翻译测试")
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="使用 Batch API 离线批量翻译（费用更低，适合大文档）"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="不使用持久化翻译缓存"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=str(project_root / "tmp_results" / "translation_cache"),
+        help="持久化翻译缓存目录"
+    )
+    parser.add_argument(
+        "--rpm",
+        type=int,
+        default=500,
+        help="异步翻译的每分钟请求数上限（0 表示不限速）"
+    )
+    args = parser.parse_args()
+    
     # 配置日志
     logger.remove()
     logger.add(
@@ -449,20 +1271,22 @@ def main():
     output_dir = project_root / "tmp_results" / "translation_test"
     
     # 创建翻译测试器（LiteLLM 模型字符串）
-    tester = TranslationTester(
+    with TranslationTester(
         model="openai/qwen3-max",
         temperature=0.3,
         max_tokens=32000,
         timeout=600,
-    )
-    
-    # 运行翻译测试
-    tester.run_translation_tests(
-        mineru_json_path=str(mineru_json_path),
-        output_dir=str(output_dir),
-        page_limit=None,  # 设置为None可测试所有页
-        language_limit=None  # 设置为None可测试所有语言
-    )
+        cache_dir=None if args.no_cache else args.cache_dir,
+        requests_per_minute=args.rpm or None,
+    ) as tester:
+        # 运行翻译测试
+        run = tester.run_translation_tests_batch if args.batch else tester.run_translation_tests
+        run(
+            mineru_json_path=str(mineru_json_path),
+            output_dir=str(output_dir),
+            page_limit=None,  # 设置为None可测试所有页
+            language_limit=None  # 设置为None可测试所有语言
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""BaseRepository.bulk_insert 单元测试（内存 SQLite，不依赖 MySQL 服务）。"""
+
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from src.db.mysql.models.base.chunk_meta_info import ChunkMetaInfo
+from src.db.mysql.repositories.base_repository import BaseRepository
+
+
+def _session() -> Session:
+    engine = create_engine("sqlite://")
+    ChunkMetaInfo.__table__.create(engine)
+    return Session(engine)
+
+
+class TestBulkInsert:
+    def test_mixed_key_sets_keep_every_column(self):
+        # 文本 chunk 在前、图片 chunk 在后：图片字段不能因首行没有这些键而被丢弃
+        text_row = {"chunk_id": "c1", "chunk_type": "text", "page_index": 0}
+        image_row = {
+            "chunk_id": "c2",
+            "chunk_type": "image",
+            "page_index": 1,
+            "bucket_name": "bucket",
+            "image_file_path": "images/c2.png",
+        }
+        repo = BaseRepository(ChunkMetaInfo)
+        with _session() as session:
+            assert repo.bulk_insert(session, [text_row, image_row, dict(text_row, chunk_id="c3")])
+            rows = session.execute(
+                select(
+                    ChunkMetaInfo.chunk_id,
+                    ChunkMetaInfo.bucket_name,
+                    ChunkMetaInfo.image_file_path,
+                ).order_by(ChunkMetaInfo.chunk_id)
+            ).all()
+        assert [tuple(r) for r in rows] == [
+            ("c1", None, None),
+            ("c2", "bucket", "images/c2.png"),
+            ("c3", None, None),
+        ]
+
+    def test_missing_columns_use_column_default(self):
+        repo = BaseRepository(ChunkMetaInfo)
+        with _session() as session:
+            assert repo.bulk_insert(
+                session,
+                [{"chunk_id": "c1"}, {"chunk_id": "c2", "chunk_type": "text"}],
+                chunk_size=1,
+            )
+            create_times = session.execute(select(ChunkMetaInfo.create_time)).scalars().all()
+        assert len(create_times) == 2 and all(create_times)
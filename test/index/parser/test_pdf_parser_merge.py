@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""PDFParser 分页合并 / PDF 截取单元测试（不依赖 MinerU 服务）。"""
+
+import sys
+from io import BytesIO
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from pypdf import PdfReader, PdfWriter
+
+from src.index.common_file_extract.parser.pdf_parser import PDFParser
+
+
+def _batch(pages, content):
+    return {
+        "status": "success",
+        "struct_content": {
+            "root": [
+                {"page_idx": i, "page_info": [{"type": "text", "page_idx": i}]}
+                for i in range(pages)
+            ]
+        },
+        "content": content,
+    }
+
+
+def _blank_pdf(pages: int) -> bytes:
+    writer = PdfWriter()
+    for i in range(pages):
+        writer.add_blank_page(width=100 + i, height=100)
+    out = BytesIO()
+    writer.write(out)
+    return out.getvalue()
+
+
+class TestMergeResults:
+    def test_page_idx_offset_and_content_join(self):
+        parser = PDFParser(mineru_client=None)
+        merged = parser._merge_results(
+            [_batch(2, "a"), _batch(2, ""), _batch(1, "c")],
+            [(0, 1), (2, 3), (4, 4)],
+        )
+        root = merged["struct_content"]["root"]
+        assert [p["page_idx"] for p in root] == [0, 1, 2, 3, 4]
+        assert [p["page_info"][0]["page_idx"] for p in root] == [0, 1, 2, 3, 4]
+        assert merged["content"] == "a\n\nc"
+        assert merged["total_pages"] == 5
+
+    def test_single_result_is_offset_in_place(self):
+        parser = PDFParser(mineru_client=None)
+        result = _batch(2, "x")
+        merged = parser._merge_results([result], [(4, 5)])
+        assert merged is result
+        assert [p["page_idx"] for p in merged["struct_content"]["root"]] == [4, 5]
+
+    def test_empty(self):
+        assert PDFParser(mineru_client=None)._merge_results([], []) == {}
+
+
+class TestSlicePdf:
+    def test_slice_keeps_only_requested_pages(self):
+        parser = PDFParser(mineru_client=None)
+        sliced = parser._slice_pdf(_blank_pdf(6), 2, 4)
+        reader = PdfReader(BytesIO(sliced))
+        assert [float(p.mediabox.width) for p in reader.pages] == [102.0, 103.0, 104.0]
+
+    def test_slice_ranges_from_one_reader(self):
+        parser = PDFParser(mineru_client=None)
+        slices = parser._slice_pdf_ranges(_blank_pdf(5), [(0, 1), (2, 3), (4, 4)])
+        widths = [
+            [float(p.mediabox.width) for p in PdfReader(BytesIO(s)).pages] for s in slices
+        ]
+        assert widths == [[100.0, 101.0], [102.0, 103.0], [104.0]]
+
+    def test_slice_ranges_invalid_pdf_falls_back(self):
+        parser = PDFParser(mineru_client=None)
+        assert parser._slice_pdf_ranges(b"not a pdf", [(0, 1), (2, 2)]) == [None, None]
+
+
+class TestPageCount:
+    def test_page_count_from_bytes(self):
+        assert PDFParser(mineru_client=None).get_pdf_pages_from_bytes(_blank_pdf(7)) == 7
+
+
+class TestPaginationMerge:
+    def test_out_of_order_batches_merge_in_page_order(self):
+        import asyncio
+        import time
+
+        class _FakeClient:
+            def parse_file(self, file_bytes, file_name, start_page_id, end_page_id):
+                pages = PdfReader(BytesIO(file_bytes)).pages
+                first_width = int(float(pages[0].mediabox.width))
+                # 前面的批次更慢返回，验证乱序完成时仍按页序合并
+                time.sleep(0.05 if first_width < 102 else 0)
+                return _batch(end_page_id - start_page_id + 1, str(first_width))
+
+        parser = PDFParser(
+            mineru_client=_FakeClient(), max_pages_per_request=2, max_concurrent_requests=3
+        )
+        merged = asyncio.run(parser._parse_with_pagination(_blank_pdf(5), "a.pdf", 5))
+        root = merged["struct_content"]["root"]
+        assert [p["page_idx"] for p in root] == [0, 1, 2, 3, 4]
+        assert merged["content"] == "100\n\n102\n\n104"
+        assert merged["total_pages"] == 5
+
+    def test_failed_batch_cancels_remaining_batches(self):
+        import asyncio
+
+        import pytest
+
+        calls = []
+
+        class _FailingClient:
+            def parse_file(self, file_bytes, file_name, start_page_id, end_page_id):
+                calls.append(file_name)
+                raise RuntimeError("mineru down")
+
+        parser = PDFParser(
+            mineru_client=_FailingClient(), max_pages_per_request=1, max_concurrent_requests=1
+        )
+        with pytest.raises(RuntimeError, match="mineru down"):
+            asyncio.run(parser._parse_with_pagination(_blank_pdf(6), "a.pdf", 6))
+        # 并发为 1：首个批次失败后，排队中的批次被取消，不会把 6 个批次都请求一遍
+        # （释放信号量时至多有一个等待者已被唤醒）
+        assert len(calls) <= 2
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""src/prompts/background/translation.py 渲染函数单元测试。"""
+
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.prompts.background.translation import (
+    build_packed_translation_input,
+    language_translation_packed_user_prompt,
+    language_translation_system_prompt,
+    language_translation_user_prompt,
+    parse_packed_translation_output,
+    render_language_translation_packed_user_prompt,
+    render_language_translation_system_prompt,
+    render_language_translation_user_prompt,
+)
+
+
+def test_render_matches_str_format():
+    for code, name in [("zh-CN", "Simplified Chinese"), ("ja", "Japanese"), ("x", "{}")]:
+        expected = language_translation_system_prompt.format(
+            TARGET_LANGUAGE_CODE=code,
+            TARGET_LANGUAGE_NAME=name,
+        )
+        assert render_language_translation_system_prompt(code, name) == expected
+
+
+def test_render_has_no_placeholders_left():
+    prompt = render_language_translation_system_prompt("fr", "French")
+    assert "{TARGET_LANGUAGE" not in prompt
+    assert "`fr`" in prompt and "`French`" in prompt
+
+
+def test_render_is_cached_per_language():
+    first = render_language_translation_system_prompt("de", "German")
+    assert render_language_translation_system_prompt("de", "German") is first
+
+
+def test_packed_input_round_trips():
+    texts = ["first page", "second\n\npage with\nlines", ""]
+    packed = build_packed_translation_input(texts)
+    assert parse_packed_translation_output(packed, len(texts)) == texts
+
+
+def test_packed_output_with_missing_segment_is_rejected():
+    packed = build_packed_translation_input(["a", "b", "c"])
+    broken = packed.replace("<<<END_1>>>", "")
+    assert parse_packed_translation_output(broken, 3) is None
+    assert parse_packed_translation_output(packed, 2) is None
+
+
+def test_render_user_prompts_match_str_format():
+    for text in ["hello", "", "{input_text} {0} {{braces}}", "多行\n文本"]:
+        assert render_language_translation_user_prompt(text) == (
+            language_translation_user_prompt.format(input_text=text)
+        )
+        assert render_language_translation_packed_user_prompt(text) == (
+            language_translation_packed_user_prompt.format(input_text=text)
+        )